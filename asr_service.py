@@ -35,6 +35,9 @@ class ASRService:
         self.is_model_loaded = False
         self.result_callback = result_callback # Callback to send transcription results to
         self.greedy_decoder = None # For RNNT state reset
+        # NeMo's transcribe() isn't thread-safe; held around every asr_model call,
+        # including the live preview's
+        self.model_lock = threading.Lock()
 
         self.request_queue = queue.Queue()
         self._asr_worker_thread = threading.Thread(target=self._asr_worker_loop)
@@ -78,7 +81,7 @@ class ASRService:
             print(f"ASR_SERVICE (worker): Model '{type(self.asr_model).__name__}' loaded on {self.device}.")
             
             # Warm-up call
-            with torch.no_grad():
+            with self.model_lock, torch.no_grad():
                 dummy_input = np.zeros(16000, dtype=np.float32)
                 self.asr_model.transcribe([dummy_input], batch_size=1)
             print("ASR_SERVICE (worker): Model warmed up.")
@@ -235,7 +238,8 @@ class ASRService:
                     break
                 
                 audio_data_np = request # Assuming request is the numpy audio array
-                transcribed_text, error = self._perform_transcription_on_worker(audio_data_np)
+                with self.model_lock: # Waits out an in-flight preview
+                    transcribed_text, error = self._perform_transcription_on_worker(audio_data_np)
                 
                 if self.result_callback:
                     self.result_callback(transcribed_text, error)
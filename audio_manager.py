@@ -17,6 +17,18 @@ def log_print(*args, **kwargs):
 
 print = log_print
 
+
+def chunk_sum_of_squares(chunk):
+    """
+    Return the sum of squared samples of an int16 audio chunk.
+
+    One pass over a flat view with an int64 accumulator: no temporary arrays,
+    and no int16 overflow (which np.dot on int16 input would hit).
+    """
+    flat = chunk.reshape(-1)
+    return float(np.einsum('i,i->', flat, flat, dtype=np.int64))
+
+
 class AudioManager:
     def __init__(self, sample_rate=16000, channels=1, dtype='int16', chunk_size=1024):
         self.sample_rate = sample_rate
@@ -35,6 +47,11 @@ class AudioManager:
         self._is_prewarmed = False
         self._prewarm_error = None
 
+    @property
+    def is_recording(self):
+        """Whether a recording session is open (the read loop may still be winding down)."""
+        return self._is_recording
+
     @property
     def is_prewarmed(self):
         """Check if audio subsystem has been pre-warmed."""
@@ -5,20 +5,17 @@ Uses PyObjC/AppKit for native macOS integration.
 """
 
 import objc
+import os
 import time
 import logging
 from typing import Union
 
-# Use the same logging as main.py
+# Use the same logging as main.py. Per-show diagnostics are logged at DEBUG
+# and only emitted when YT_DEBUG is set, so the show() path stays I/O-free.
 logger = logging.getLogger('CorrectionWindow')
+if not os.environ.get("YT_DEBUG"):
+    logger.setLevel(logging.INFO)
 
-def log_print(*args):
-    """Log to the shared log file"""
-    message = ' '.join(str(arg) for arg in args)
-    logger.info(message)
-
-# Use log_print for all prints in this module
-print = log_print
 from AppKit import (
     NSWindow, NSView, NSTextField, NSButton, NSTextView, NSScrollView,
     NSWindowStyleMaskTitled, NSWindowStyleMaskClosable, NSWindowStyleMaskResizable,
@@ -34,6 +31,7 @@ from AppKit import (
     NSSegmentSwitchTrackingSelectOne,
 )
 from Foundation import NSRect, NSPoint, NSSize, NSObject, NSMakeRange, NSNotificationCenter
+from Quartz import CATransaction
 
 from transcription_result import TranscriptionResult
 
@@ -55,6 +53,36 @@ BUTTON_WIDTH = 100
 MODE_EDIT = 0
 MODE_TIMESTAMPS = 1
 
+# The general pasteboard is a process-wide singleton; resolve it (and the
+# bound setter) once instead of on every copy.
+_GENERAL_PB = NSPasteboard.generalPasteboard()
+_pb_set_string = _GENERAL_PB.setString_forType_
+# prepareForNewContentsWithOptions: replaces clearContents on newer macOS
+_pb_prepare = getattr(_GENERAL_PB, "prepareForNewContentsWithOptions_", None)
+
+
+def _prepare_pasteboard():
+    """Empty the general pasteboard so new contents can be written."""
+    if _pb_prepare is not None:
+        _pb_prepare(0)
+    else:
+        _GENERAL_PB.clearContents()
+
+
+def _replace_text(text_view, text):
+    """
+    Replace all text in a view with a single coalesced storage edit.
+
+    Goes through the view (not the storage directly) so the view's typing
+    attributes are applied, matching setString_.
+    """
+    storage = text_view.textStorage()
+    storage.beginEditing()
+    try:
+        text_view.replaceCharactersInRange_withString_(NSMakeRange(0, storage.length()), text)
+    finally:
+        storage.endEditing()
+
 
 class CorrectionTextView(NSTextView):
     """Custom NSTextView that handles Enter and Escape keys."""
@@ -197,8 +225,9 @@ class CorrectionWindow:
         self._current_mode = MODE_EDIT
         self._is_visible = False
         self._previous_app = None  # Store the app that had focus before showing window
+        self._laid_out_size = None  # Content size the current subviews were built for
         self._setup_window()
-        print("CORRECTION: Window initialized")
+        logger.debug("CORRECTION: Window initialized")
 
     def _setup_window(self):
         """Create and configure the correction window."""
@@ -270,6 +299,7 @@ class CorrectionWindow:
         content_frame = content_view.frame()
         width = content_frame.size.width
         height = content_frame.size.height
+        self._laid_out_size = (width, height)
 
         # Clear existing subviews
         for subview in list(content_view.subviews()):
@@ -416,7 +446,7 @@ class CorrectionWindow:
         self._target_app_label.setTextColor_(NSColor.secondaryLabelColor())
         self._target_app_label.setFont_(NSFont.systemFontOfSize_(11))
         toolbar_view.addSubview_(self._target_app_label)
-        print(f"CORRECTION: Created _target_app_label with frame: {target_app_frame}")
+        logger.debug("CORRECTION: Created _target_app_label with frame: %s", target_app_frame)
 
         # Copy button on the right
         copy_frame = NSRect(NSPoint(width - 160, 6), NSSize(70, 28))
@@ -465,7 +495,7 @@ class CorrectionWindow:
             return
 
         self._current_mode = new_mode
-        print(f"CORRECTION: Mode changed to {'Timestamps' if new_mode == MODE_TIMESTAMPS else 'Edit'}")
+        logger.debug("CORRECTION: Mode changed to %s", "Timestamps" if new_mode == MODE_TIMESTAMPS else "Edit")
 
         if new_mode == MODE_EDIT:
             # Show edit view, hide timestamp view
@@ -544,6 +574,31 @@ class CorrectionWindow:
         insert_button.setKeyEquivalent_("\r")  # Enter key
         parent_view.addSubview_(insert_button)
 
+    def _ensure_layout(self):
+        """Rebuild subviews only if the content size changed since the last layout."""
+        content_size = self._window.contentView().frame().size
+        if self._laid_out_size != (content_size.width, content_size.height):
+            self._layout_views()
+            return
+
+        # Reuse existing views; just reset them to a fresh edit-mode state
+        self._scroll_view.setHidden_(False)
+        self._timestamp_scroll_view.setHidden_(True)
+        undo_manager = self._text_view.undoManager()
+        if undo_manager:
+            undo_manager.removeAllActions()
+
+    def prewarm(self):
+        """
+        Realize the window's views off-screen so the first show() is cheap.
+
+        Must be called on the main thread.
+        """
+        self._ensure_layout()
+        self._window.displayIfNeeded()
+        self._window.orderOut_(None)
+        logger.debug("CORRECTION: Window prewarmed")
+
     def _update_layout(self):
         """Update layout when window is resized."""
         # Save current mode and text before rebuilding
@@ -554,7 +609,7 @@ class CorrectionWindow:
 
         # Restore text content
         if saved_text:
-            self._text_view.setString_(saved_text)
+            _replace_text(self._text_view, saved_text)
             self._text_view.set_callbacks(self._do_send, self._do_cancel, self._update_status)
 
         # Restore mode state
@@ -627,7 +682,8 @@ class CorrectionWindow:
     def _do_send(self):
         """Handle send action."""
         corrected_text = self._text_view.string()
-        print(f"CORRECTION: Insert clicked. Original: '{self._original_text[:30]}...', Corrected: '{corrected_text[:30]}...'")
+        logger.info("CORRECTION: Insert clicked. Original: '%.30s...', Corrected: '%.30s...'",
+                    self._original_text, corrected_text)
 
         # Hide window immediately
         self._is_visible = False
@@ -644,7 +700,7 @@ class CorrectionWindow:
 
     def _do_cancel(self):
         """Handle cancel action."""
-        print("CORRECTION: Discard clicked")
+        logger.info("CORRECTION: Discard clicked")
         self.hide()
 
         if self._on_cancel_callback:
@@ -654,21 +710,20 @@ class CorrectionWindow:
         """Copy current text to clipboard."""
         text = self._text_view.string()
         if text:
-            pb = NSPasteboard.generalPasteboard()
-            pb.clearContents()
-            pb.setString_forType_(text, NSPasteboardTypeString)
+            _prepare_pasteboard()
+            _pb_set_string(text, NSPasteboardTypeString)
 
             # Update instruction to confirm copy
             if self._instruction_label:
                 self._instruction_label.setStringValue_("Copied to clipboard!")
                 # Reset after 2 seconds (would need a timer, for now just leave it)
-        print(f"CORRECTION: Copied {len(text)} characters to clipboard")
+        logger.info("CORRECTION: Copied %d characters to clipboard", len(text))
 
     def _do_clear(self):
         """Clear all text."""
         self._text_view.setString_("")
         self._update_status()
-        print("CORRECTION: Text cleared")
+        logger.debug("CORRECTION: Text cleared")
 
     def _on_window_close(self):
         """Called when window is closed via X button."""
@@ -689,76 +744,81 @@ class CorrectionWindow:
             self._transcription_result = transcription
             # Use formatted text with paragraph breaks between segments
             text = transcription.formatted_with_breaks()
-            print(f"CORRECTION: show() called with TranscriptionResult: '{text[:50]}...'")
-            print(f"CORRECTION: Duration: {transcription.formatted_duration()}, has_timestamps: {transcription.has_timestamps}")
-            if transcription.has_timestamps:
-                print(f"CORRECTION: Text formatted with {len(transcription.segment_timestamps)} paragraph breaks")
+            logger.debug("CORRECTION: show() called with TranscriptionResult: '%.50s...'", text)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("CORRECTION: Duration: %s, has_timestamps: %s",
+                             transcription.formatted_duration(), transcription.has_timestamps)
+                if transcription.has_timestamps:
+                    logger.debug("CORRECTION: Text formatted with %d paragraph breaks",
+                                 len(transcription.segment_timestamps))
         else:
             # Plain string - wrap in TranscriptionResult for consistency
             text = str(transcription)
             self._transcription_result = TranscriptionResult.from_text_only(text)
-            print(f"CORRECTION: show() called with plain text: '{text[:50]}...'")
+            logger.debug("CORRECTION: show() called with plain text: '%.50s...'", text)
 
         # Capture the currently focused app BEFORE showing our window
         workspace = NSWorkspace.sharedWorkspace()
         self._previous_app = workspace.frontmostApplication()
-        if self._previous_app:
-            print(f"CORRECTION: Stored previous app: {self._previous_app.localizedName()}")
+        if self._previous_app and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CORRECTION: Stored previous app: %s", self._previous_app.localizedName())
 
         self._original_text = text
         self._current_text = text
         self._current_mode = MODE_EDIT  # Reset to edit mode
 
-        # Ensure layout is fresh (this recreates all UI elements)
-        self._layout_views()
-
-        # Update duration label
-        if self._duration_label and self._transcription_result:
-            duration_str = self._transcription_result.formatted_duration()
-            self._duration_label.setStringValue_(f" Duration: {duration_str}")
-            print(f"CORRECTION: Set duration label to: 'Duration: {duration_str}'")
-
-        # Update mode toggle state and enable/disable timestamps mode
-        if self._mode_toggle:
-            self._mode_toggle.setSelectedSegment_(MODE_EDIT)
-            # Disable timestamps segment if no timestamp data
-            has_timestamps = self._transcription_result and self._transcription_result.has_timestamps
-            self._mode_toggle.setEnabled_forSegment_(has_timestamps, MODE_TIMESTAMPS)
-            if not has_timestamps:
-                # Visual feedback that timestamps aren't available
-                self._mode_toggle.setLabel_forSegment_("Timestamps (N/A)", MODE_TIMESTAMPS)
-            else:
-                self._mode_toggle.setLabel_forSegment_("Timestamps", MODE_TIMESTAMPS)
-
-        # Update target app label AFTER _layout_views() since it recreates the label
-        print(f"CORRECTION: _target_app_label exists: {self._target_app_label is not None}")
-        print(f"CORRECTION: _previous_app exists: {self._previous_app is not None}")
-        if self._target_app_label:
-            if self._previous_app:
-                app_name = self._previous_app.localizedName()
-                label_text = f"Insert into: {app_name}"
-                self._target_app_label.setStringValue_(label_text)
-                print(f"CORRECTION: Set target app label to: '{label_text}'")
-                print(f"CORRECTION: Label frame: {self._target_app_label.frame()}")
-                print(f"CORRECTION: Label superview: {self._target_app_label.superview()}")
-            else:
-                self._target_app_label.setStringValue_("Insert into: (unknown)")
-                print("CORRECTION: Set target app label to: 'Insert into: (unknown)'")
-
-        # Set the text in the text view
-        self._text_view.setString_(text)
-        self._text_view.set_callbacks(self._do_send, self._do_cancel, self._update_status)
+        # Apply all label/control updates in one non-animated commit
+        CATransaction.begin()
+        CATransaction.setDisableActions_(True)
+        try:
+            # Reuse the existing views unless the window size changed
+            self._ensure_layout()
+
+            # Update duration label
+            if self._duration_label and self._transcription_result:
+                duration_str = self._transcription_result.formatted_duration()
+                self._duration_label.setStringValue_(f" Duration: {duration_str}")
+                logger.debug("CORRECTION: Set duration label to: 'Duration: %s'", duration_str)
+
+            # Update mode toggle state and enable/disable timestamps mode
+            if self._mode_toggle:
+                self._mode_toggle.setSelectedSegment_(MODE_EDIT)
+                # Disable timestamps segment if no timestamp data
+                has_timestamps = self._transcription_result and self._transcription_result.has_timestamps
+                self._mode_toggle.setEnabled_forSegment_(has_timestamps, MODE_TIMESTAMPS)
+                if not has_timestamps:
+                    # Visual feedback that timestamps aren't available
+                    self._mode_toggle.setLabel_forSegment_("Timestamps (N/A)", MODE_TIMESTAMPS)
+                else:
+                    self._mode_toggle.setLabel_forSegment_("Timestamps", MODE_TIMESTAMPS)
+
+            # Update target app label AFTER _ensure_layout() since it may recreate the label
+            if self._target_app_label:
+                if self._previous_app:
+                    app_name = self._previous_app.localizedName()
+                    label_text = f"Insert into: {app_name}"
+                    self._target_app_label.setStringValue_(label_text)
+                    logger.debug("CORRECTION: Set target app label to: '%s'", label_text)
+                else:
+                    self._target_app_label.setStringValue_("Insert into: (unknown)")
+                    logger.debug("CORRECTION: Set target app label to: 'Insert into: (unknown)'")
+
+            # Set the text in the text view
+            _replace_text(self._text_view, text)
+            self._text_view.set_callbacks(self._do_send, self._do_cancel, self._update_status)
 
-        # Select all text for easy replacement
-        text_length = len(text)
-        self._text_view.setSelectedRange_(NSMakeRange(0, text_length))
+            # Select all text for easy replacement
+            text_length = len(text)
+            self._text_view.setSelectedRange_(NSMakeRange(0, text_length))
 
-        # Update status
-        self._update_status()
+            # Update status
+            self._update_status()
 
-        # Reset instruction
-        if self._instruction_label:
-            self._instruction_label.setStringValue_("Edit your transcription. Press Enter to insert, Escape to cancel.")
+            # Reset instruction
+            if self._instruction_label:
+                self._instruction_label.setStringValue_("Edit your transcription. Press Enter to insert, Escape to cancel.")
+        finally:
+            CATransaction.commit()
 
         # Position near cursor
         self._position_near_cursor()
@@ -773,7 +833,7 @@ class CorrectionWindow:
         # Focus the text view within our window
         self._window.makeFirstResponder_(self._text_view)
 
-        print("CORRECTION: Window should now be visible")
+        logger.debug("CORRECTION: Window should now be visible")
 
     def hide(self):
         """Hide the correction window."""
@@ -781,12 +841,12 @@ class CorrectionWindow:
             return
         self._is_visible = False
         self._window.orderOut_(None)
-        print("CORRECTION: Window hidden")
+        logger.debug("CORRECTION: Window hidden")
 
     def restore_previous_app_focus(self):
         """Restore focus to the app that was active before correction window."""
         if self._previous_app:
-            print(f"CORRECTION: Restoring focus to: {self._previous_app.localizedName()}")
+            logger.info("CORRECTION: Restoring focus to: %s", self._previous_app.localizedName())
             self._previous_app.activateWithOptions_(0)
             time.sleep(0.1)  # Small delay for focus to settle
             self._previous_app = None
@@ -804,13 +864,12 @@ class CorrectionWindow:
         if not text:
             return False
         try:
-            pb = NSPasteboard.generalPasteboard()
-            pb.clearContents()
-            pb.setString_forType_(text, NSPasteboardTypeString)
-            print(f"CORRECTION: Silently copied {len(text)} characters to clipboard")
+            _prepare_pasteboard()
+            _pb_set_string(text, NSPasteboardTypeString)
+            logger.info("CORRECTION: Silently copied %d characters to clipboard", len(text))
             return True
         except Exception as e:
-            print(f"CORRECTION: Failed to copy to clipboard: {e}")
+            logger.warning("CORRECTION: Failed to copy to clipboard: %s", e)
             return False
 
     def get_target_app_name(self) -> str:
@@ -835,7 +894,7 @@ class CorrectionWindow:
         This is a heuristic - we can't know for certain if the cursor is in a text field.
         """
         if not self._previous_app:
-            print("CORRECTION: No previous app - assuming NOT text-accepting")
+            logger.info("CORRECTION: No previous app - assuming NOT text-accepting")
             return False
 
         bundle_id = self._previous_app.bundleIdentifier() or ""
@@ -856,20 +915,20 @@ class CorrectionWindow:
 
         # Check bundle ID
         if bundle_id in non_text_apps:
-            print(f"CORRECTION: Target app '{app_name}' ({bundle_id}) is in non-text-apps list")
+            logger.info("CORRECTION: Target app '%s' (%s) is in non-text-apps list", app_name, bundle_id)
             return False
 
         # Special check for Finder - even if not in desktop, text input is rare
         if bundle_id == "com.apple.finder":
-            print(f"CORRECTION: Target is Finder - likely NOT text-accepting")
+            logger.info("CORRECTION: Target is Finder - likely NOT text-accepting")
             return False
 
         # If bundle ID is empty or unknown, be cautious
         if not bundle_id:
-            print(f"CORRECTION: Target app '{app_name}' has no bundle ID - assuming NOT text-accepting")
+            logger.info("CORRECTION: Target app '%s' has no bundle ID - assuming NOT text-accepting", app_name)
             return False
 
-        print(f"CORRECTION: Target app '{app_name}' ({bundle_id}) is likely text-accepting")
+        logger.info("CORRECTION: Target app '%s' (%s) is likely text-accepting", app_name, bundle_id)
         return True
 
     @property
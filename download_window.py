@@ -3,6 +3,9 @@ Native macOS progress window for first-launch model download.
 Uses PyObjC/AppKit for native integration.
 """
 
+import functools
+from contextlib import contextmanager
+
 import objc
 from AppKit import (
     NSWindow, NSView, NSTextField, NSButton, NSProgressIndicator,
@@ -13,37 +16,71 @@ from AppKit import (
     NSCenterTextAlignment,
 )
 from Foundation import NSRect, NSPoint, NSSize, NSObject
+from Quartz import CATransaction
 
 WINDOW_WIDTH = 420
 WINDOW_HEIGHT = 220
 
+# Static subview frames (window size is fixed), laid out top to bottom
+_CONTENT_FRAME = NSRect(NSPoint(0, 0), NSSize(WINDOW_WIDTH, WINDOW_HEIGHT))
+_STATUS_FRAME = NSRect(NSPoint(20, 175), NSSize(WINDOW_WIDTH - 40, 22))
+_PROGRESS_FRAME = NSRect(NSPoint(20, 140), NSSize(WINDOW_WIDTH - 40, 20))
+_PERCENT_FRAME = NSRect(NSPoint(20, 115), NSSize(WINDOW_WIDTH - 40, 18))
+_BYTES_FRAME = NSRect(NSPoint(20, 95), NSSize(WINDOW_WIDTH - 40, 18))
+_SPEED_FRAME = NSRect(NSPoint(20, 77), NSSize(WINDOW_WIDTH - 40, 18))
+_CANCEL_FRAME = NSRect(NSPoint(WINDOW_WIDTH / 2 - 50, 15), NSSize(100, 32))
+_RETRY_FRAME = NSRect(NSPoint(WINDOW_WIDTH / 2 - 110, 15), NSSize(100, 32))
+_QUIT_FRAME = NSRect(NSPoint(WINDOW_WIDTH / 2 + 10, 15), NSSize(100, 32))
+
+# Dynamic system color; resolves per appearance at draw time, so it is safe to share
+_SECONDARY = NSColor.secondaryLabelColor()
+
+
+# (upper bound, formatter) pairs; the first bound the value falls under wins.
+# Divisors are literal constants so no multiplication happens per call.
+_BYTE_FMTS = (
+    (1024, lambda b: f"{b} B"),
+    (1048576, lambda b: f"{b / 1024:.0f} KB"),
+    (1073741824, lambda b: f"{b / 1048576:.1f} MB"),
+    (float("inf"), lambda b: f"{b / 1073741824:.2f} GB"),
+)
+
+_ETA_FMTS = (
+    (60, lambda s: f"{int(s)}s remaining"),
+    (3600, lambda s: f"{int(s // 60)}m {int(s % 60)}s remaining"),
+    (float("inf"), lambda s: f"{int(s // 3600)}h {int((s % 3600) // 60)}m remaining"),
+)
+
 
 def _format_bytes(b):
     """Format byte count as human-readable string."""
-    if b < 1024:
-        return f"{b} B"
-    elif b < 1024 * 1024:
-        return f"{b / 1024:.0f} KB"
-    elif b < 1024 * 1024 * 1024:
-        return f"{b / (1024 * 1024):.1f} MB"
-    else:
-        return f"{b / (1024 * 1024 * 1024):.2f} GB"
+    return next(fn(b) for thresh, fn in _BYTE_FMTS if b < thresh)
 
 
 def _format_eta(seconds):
     """Format seconds remaining as human-readable string."""
     if seconds <= 0:
         return ""
-    if seconds < 60:
-        return f"{int(seconds)}s remaining"
-    elif seconds < 3600:
-        m = int(seconds // 60)
-        s = int(seconds % 60)
-        return f"{m}m {s}s remaining"
-    else:
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        return f"{h}h {m}m remaining"
+    return next(fn(seconds) for thresh, fn in _ETA_FMTS if seconds < thresh)
+
+
+@functools.lru_cache(maxsize=32)
+def _font(bold, size):
+    """Return the (memoized) system font for the given weight and size."""
+    if bold:
+        return NSFont.boldSystemFontOfSize_(size)
+    return NSFont.systemFontOfSize_(size)
+
+
+@contextmanager
+def _without_implicit_animations():
+    """Apply a batch of view property changes in one non-animated commit."""
+    CATransaction.begin()
+    CATransaction.setDisableActions_(True)
+    try:
+        yield
+    finally:
+        CATransaction.commit()
 
 
 class DownloadWindowDelegate(NSObject):
@@ -121,23 +158,17 @@ class DownloadProgressWindow:
         self._delegate = DownloadWindowDelegate.alloc().initWithCallbacks_(callbacks)
         self._window.setDelegate_(self._delegate)
 
-        content = NSView.alloc().initWithFrame_(
-            NSRect(NSPoint(0, 0), NSSize(WINDOW_WIDTH, WINDOW_HEIGHT))
-        )
+        content = NSView.alloc().initWithFrame_(_CONTENT_FRAME)
 
         # --- Status label ---
-        y_pos = 175
         self._status_label = self._make_label(
             content, "Downloading speech recognition model...",
-            NSRect(NSPoint(20, y_pos), NSSize(WINDOW_WIDTH - 40, 22)),
+            _STATUS_FRAME,
             bold=True, size=13,
         )
 
         # --- Progress bar ---
-        y_pos -= 35
-        self._progress_bar = NSProgressIndicator.alloc().initWithFrame_(
-            NSRect(NSPoint(20, y_pos), NSSize(WINDOW_WIDTH - 40, 20))
-        )
+        self._progress_bar = NSProgressIndicator.alloc().initWithFrame_(_PROGRESS_FRAME)
         self._progress_bar.setStyle_(NSProgressIndicatorStyleBar)
         self._progress_bar.setMinValue_(0)
         self._progress_bar.setMaxValue_(100)
@@ -146,38 +177,31 @@ class DownloadProgressWindow:
         content.addSubview_(self._progress_bar)
 
         # --- Percent label ---
-        y_pos -= 25
         self._percent_label = self._make_label(
             content, "0%",
-            NSRect(NSPoint(20, y_pos), NSSize(WINDOW_WIDTH - 40, 18)),
+            _PERCENT_FRAME,
             size=12, alignment=NSCenterTextAlignment,
         )
 
         # --- Bytes label ---
-        y_pos -= 20
         self._bytes_label = self._make_label(
             content, "",
-            NSRect(NSPoint(20, y_pos), NSSize(WINDOW_WIDTH - 40, 18)),
-            size=11, color=NSColor.secondaryLabelColor(),
+            _BYTES_FRAME,
+            size=11, color=_SECONDARY,
             alignment=NSCenterTextAlignment,
         )
 
         # --- Speed / ETA label ---
-        y_pos -= 18
         self._speed_label = self._make_label(
             content, "",
-            NSRect(NSPoint(20, y_pos), NSSize(WINDOW_WIDTH - 40, 18)),
-            size=11, color=NSColor.secondaryLabelColor(),
+            _SPEED_FRAME,
+            size=11, color=_SECONDARY,
             alignment=NSCenterTextAlignment,
         )
 
         # --- Buttons ---
-        btn_y = 15
-
         # Cancel button (always visible)
-        self._cancel_button = NSButton.alloc().initWithFrame_(
-            NSRect(NSPoint(WINDOW_WIDTH / 2 - 50, btn_y), NSSize(100, 32))
-        )
+        self._cancel_button = NSButton.alloc().initWithFrame_(_CANCEL_FRAME)
         self._cancel_button.setTitle_("Cancel")
         self._cancel_button.setBezelStyle_(NSBezelStyleRounded)
         self._cancel_button.setTarget_(self._delegate)
@@ -187,9 +211,7 @@ class DownloadProgressWindow:
         content.addSubview_(self._cancel_button)
 
         # Retry button (hidden by default, shown on error)
-        self._retry_button = NSButton.alloc().initWithFrame_(
-            NSRect(NSPoint(WINDOW_WIDTH / 2 - 110, btn_y), NSSize(100, 32))
-        )
+        self._retry_button = NSButton.alloc().initWithFrame_(_RETRY_FRAME)
         self._retry_button.setTitle_("Retry")
         self._retry_button.setBezelStyle_(NSBezelStyleRounded)
         self._retry_button.setTarget_(self._delegate)
@@ -200,9 +222,7 @@ class DownloadProgressWindow:
         content.addSubview_(self._retry_button)
 
         # Quit button (hidden by default, shown on error)
-        self._quit_button = NSButton.alloc().initWithFrame_(
-            NSRect(NSPoint(WINDOW_WIDTH / 2 + 10, btn_y), NSSize(100, 32))
-        )
+        self._quit_button = NSButton.alloc().initWithFrame_(_QUIT_FRAME)
         self._quit_button.setTitle_("Quit")
         self._quit_button.setBezelStyle_(NSBezelStyleRounded)
         self._quit_button.setTarget_(self._delegate)
@@ -227,10 +247,7 @@ class DownloadProgressWindow:
         label.setDrawsBackground_(False)
         label.setEditable_(False)
         label.setSelectable_(False)
-        if bold:
-            label.setFont_(NSFont.boldSystemFontOfSize_(size))
-        else:
-            label.setFont_(NSFont.systemFontOfSize_(size))
+        label.setFont_(_font(bold, size))
         if color:
             label.setTextColor_(color)
         if alignment is not None:
@@ -251,38 +268,40 @@ class DownloadProgressWindow:
 
     def update_progress(self, downloaded, total, speed_bps):
         """Update all progress indicators."""
-        if total > 0:
-            pct = downloaded / total * 100
-            self._progress_bar.setDoubleValue_(pct)
-            self._percent_label.setStringValue_(f"{pct:.1f}%")
-            self._bytes_label.setStringValue_(
-                f"{_format_bytes(downloaded)} / {_format_bytes(total)}"
-            )
-            remaining = total - downloaded
-            if speed_bps > 0:
-                eta_sec = remaining / speed_bps
-                speed_str = f"{_format_bytes(int(speed_bps))}/s"
-                eta_str = _format_eta(eta_sec)
-                self._speed_label.setStringValue_(
-                    f"{speed_str}  —  {eta_str}" if eta_str else speed_str
+        with _without_implicit_animations():
+            if total > 0:
+                pct = downloaded / total * 100
+                self._progress_bar.setDoubleValue_(pct)
+                self._percent_label.setStringValue_(f"{pct:.1f}%")
+                self._bytes_label.setStringValue_(
+                    f"{_format_bytes(downloaded)} / {_format_bytes(total)}"
                 )
+                remaining = total - downloaded
+                if speed_bps > 0:
+                    eta_sec = remaining / speed_bps
+                    speed_str = f"{_format_bytes(int(speed_bps))}/s"
+                    eta_str = _format_eta(eta_sec)
+                    self._speed_label.setStringValue_(
+                        f"{speed_str}  —  {eta_str}" if eta_str else speed_str
+                    )
+                else:
+                    self._speed_label.setStringValue_("")
             else:
-                self._speed_label.setStringValue_("")
-        else:
-            # Unknown total — indeterminate
-            self._progress_bar.setIndeterminate_(True)
-            self._progress_bar.startAnimation_(None)
-            self._bytes_label.setStringValue_(f"{_format_bytes(downloaded)}")
+                # Unknown total — indeterminate
+                self._progress_bar.setIndeterminate_(True)
+                self._progress_bar.startAnimation_(None)
+                self._bytes_label.setStringValue_(f"{_format_bytes(downloaded)}")
 
     def show_error(self, message):
         """Switch the window to error state."""
-        self._status_label.setStringValue_("Download failed")
-        self._status_label.setTextColor_(NSColor.systemRedColor())
-        self._percent_label.setStringValue_(message)
-        self._percent_label.setTextColor_(NSColor.secondaryLabelColor())
-        self._bytes_label.setStringValue_("")
-        self._speed_label.setStringValue_("")
-        self._progress_bar.setDoubleValue_(0)
+        with _without_implicit_animations():
+            self._status_label.setStringValue_("Download failed")
+            self._status_label.setTextColor_(NSColor.systemRedColor())
+            self._percent_label.setStringValue_(message)
+            self._percent_label.setTextColor_(_SECONDARY)
+            self._bytes_label.setStringValue_("")
+            self._speed_label.setStringValue_("")
+            self._progress_bar.setDoubleValue_(0)
 
         # Show Retry + Quit, hide Cancel
         self._cancel_button.setHidden_(True)
@@ -291,16 +310,17 @@ class DownloadProgressWindow:
 
     def reset_for_retry(self):
         """Reset the window to downloading state for a retry."""
-        self._status_label.setStringValue_(
-            "Downloading speech recognition model..."
-        )
-        self._status_label.setTextColor_(NSColor.labelColor())
-        self._percent_label.setStringValue_("0%")
-        self._percent_label.setTextColor_(NSColor.labelColor())
-        self._bytes_label.setStringValue_("")
-        self._speed_label.setStringValue_("")
-        self._progress_bar.setIndeterminate_(False)
-        self._progress_bar.setDoubleValue_(0)
+        with _without_implicit_animations():
+            self._status_label.setStringValue_(
+                "Downloading speech recognition model..."
+            )
+            self._status_label.setTextColor_(NSColor.labelColor())
+            self._percent_label.setStringValue_("0%")
+            self._percent_label.setTextColor_(NSColor.labelColor())
+            self._bytes_label.setStringValue_("")
+            self._speed_label.setStringValue_("")
+            self._progress_bar.setIndeterminate_(False)
+            self._progress_bar.setDoubleValue_(0)
 
         # Show Cancel, hide Retry + Quit
         self._cancel_button.setHidden_(False)
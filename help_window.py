@@ -3,6 +3,8 @@ Native macOS Help window for YardTalk.
 Displays detailed usage instructions and keyboard shortcuts.
 """
 
+import functools
+
 import objc
 from AppKit import (
     NSWindow, NSView, NSTextField, NSButton, NSTextView, NSScrollView,
@@ -128,6 +130,28 @@ Version 1.0
 """
 
 
+@functools.cache
+def _help_style():
+    """
+    Build the help text styling on first use and reuse it afterwards.
+
+    Returns:
+        Tuple of (font, paragraph style, attributed help text).
+    """
+    font = NSFont.systemFontOfSize_(13)
+    para_style = NSMutableParagraphStyle.alloc().init()
+    para_style.setLineSpacing_(3)
+    attributed = NSAttributedString.alloc().initWithString_attributes_(
+        HELP_CONTENT.strip(),
+        {
+            NSFontAttributeName: font,
+            NSForegroundColorAttributeName: NSColor.labelColor(),
+            NSParagraphStyleAttributeName: para_style,
+        },
+    )
+    return font, para_style, attributed
+
+
 class HelpWindowDelegate(NSObject):
     """Delegate for window close events."""
 
@@ -222,17 +246,16 @@ class HelpWindow:
             NSPoint(0, 0),
             NSSize(scroll_frame.size.width - 20, scroll_frame.size.height)
         )
+        font, para_style, help_text = _help_style()
         text_view = NSTextView.alloc().initWithFrame_(text_frame)
         text_view.setEditable_(False)
         text_view.setSelectable_(True)
         text_view.setRichText_(False)
-        text_view.setFont_(NSFont.systemFontOfSize_(13))
+        text_view.setFont_(font)
         text_view.setTextColor_(NSColor.labelColor())
         text_view.setBackgroundColor_(NSColor.textBackgroundColor())
 
         # Set line spacing
-        para_style = NSMutableParagraphStyle.alloc().init()
-        para_style.setLineSpacing_(3)
         text_view.setDefaultParagraphStyle_(para_style)
 
         text_view.textContainer().setLineFragmentPadding_(10)
@@ -243,7 +266,7 @@ class HelpWindow:
         text_view.textContainer().setWidthTracksTextView_(True)
 
         # Set the help content
-        text_view.setString_(HELP_CONTENT.strip())
+        text_view.textStorage().setAttributedString_(help_text)
 
         scroll_view.setDocumentView_(text_view)
         content_view.addSubview_(scroll_view)
@@ -1,27 +1,29 @@
 from pynput import keyboard
-import traceback
+import itertools
 import subprocess
 import sys
 import logging
 import os
+import queue
+import threading
+import time
+
+# Resolve the native event API once at import rather than per event/start.
+# Other platforms (and macOS without PyObjC) fall back to pynput.
+NSEvent = None
+NSEventMaskKeyDown = None
+if sys.platform == "darwin":
+    try:
+        from Quartz import NSEvent, NSEventMaskKeyDown
+    except ImportError:
+        pass
 
-# Set up logging for hotkey manager
-log_file = os.path.expanduser("~/dictation_app.log")
+# Module logger; handlers are configured by main.py. Per-keystroke diagnostics
+# are logged at DEBUG and only emitted when YT_DEBUG is set, so the key-event
+# path does no formatting or I/O in normal use.
 logger = logging.getLogger('HotkeyManager')
-
-def log_print(*args, **kwargs):
-    """Custom print function that logs to file"""
-    message = ' '.join(str(arg) for arg in args)
-    logger.info(message)
-    # Also print to console for backward compatibility
-    import builtins
-    builtins.print(*args, **kwargs)
-
-# Replace print with our logging version for this module
-print = log_print
-
-# Check if running as bundled app
-_is_bundled = getattr(sys, "frozen", False)
+if not os.environ.get("YT_DEBUG"):
+    logger.setLevel(logging.INFO)
 
 # macOS key code mappings for native event monitoring
 # https://developer.apple.com/documentation/appkit/1535851-function-key_unicodes
@@ -42,6 +44,16 @@ MACOS_KEY_CODES = {
     123: 'left', 124: 'right', 125: 'down', 126: 'up',
 }
 
+# Presses closer together than this are treated as one (key repeat, double delivery)
+PRESS_DEBOUNCE_SECONDS = 0.15
+
+# Pending activate/deactivate callbacks; presses beyond this are dropped
+CALLBACK_QUEUE_SIZE = 8
+
+# Log only the first and then every Nth failure inside the key callbacks
+KEY_ERROR_LOG_EVERY = 100
+_STOP_WORKER = object()  # Sentinel that tells the callback worker to exit
+
 # Modifier flag masks for NSEvent
 NSEventModifierFlagCapsLock = 1 << 16
 NSEventModifierFlagShift = 1 << 17
@@ -49,201 +61,404 @@ NSEventModifierFlagControl = 1 << 18
 NSEventModifierFlagOption = 1 << 19
 NSEventModifierFlagCommand = 1 << 20
 
+# Reverse lookup so the hotkey can be matched by raw keycode
+KEY_NAME_TO_CODE = {name: code for code, name in MACOS_KEY_CODES.items()}
+
+# Modifiers that take part in hotkey matching (caps lock etc. are ignored)
+MOD_ANY_MASK = (
+    NSEventModifierFlagCommand | NSEventModifierFlagControl |
+    NSEventModifierFlagOption | NSEventModifierFlagShift
+)
+_MODIFIER_FLAGS = {
+    'cmd': NSEventModifierFlagCommand,
+    'ctrl': NSEventModifierFlagControl,
+    'alt': NSEventModifierFlagOption,
+    'shift': NSEventModifierFlagShift,
+}
+
+# Hotkey string parsing for the native monitor: drop the <> around key names
+# and map modifier aliases onto the names used in _MODIFIER_FLAGS
+_STRIP_BRACKETS = str.maketrans('', '', '<>')
+_MOD_ALIAS = {
+    'cmd': 'cmd', 'command': 'cmd',
+    'ctrl': 'ctrl', 'control': 'ctrl',
+    'alt': 'alt', 'option': 'alt',
+    'shift': 'shift',
+}
+
+# Bound once for the key callbacks
+_KEY_SPACE = keyboard.Key.space
+
+
+def _parse_native_combo(hotkey_str):
+    """
+    Split a hotkey string like '<ctrl>+<shift>+d' for native matching.
+
+    Returns:
+        Tuple of (key name or None, set of modifier names).
+    """
+    parts = hotkey_str.lower().translate(_STRIP_BRACKETS).split('+')
+    modifiers = set()
+    key = None
+
+    for part in parts:
+        part = part.strip()
+        mod = _MOD_ALIAS.get(part)
+        if mod:
+            modifiers.add(mod)
+        elif len(part) == 1:
+            # Single character key
+            key = part
+        elif part == 'space':
+            key = 'space'
+        elif part.startswith('f') and part[1:].isdigit():
+            # Function key like f9
+            key = part
+    return key, modifiers
+
+
+def _modifier_mask(modifiers):
+    """OR together the NSEvent flags for a set of modifier names."""
+    mask = 0
+    for mod in modifiers:
+        mask |= _MODIFIER_FLAGS[mod]
+    return mask
+
 class HotkeyManager:
-    def __init__(self, hotkey_str, on_activate, on_deactivate):
+    # AXIsProcessTrusted() result, shared by all instances; see
+    # clear_accessibility_cache()
+    _ax_trusted_cache = None
+
+    def __init__(self, hotkey_str, on_activate, on_deactivate, use_native=None):
         self.hotkey_str = hotkey_str
         self.on_activate = on_activate
         self.on_deactivate = on_deactivate # Placeholder for future use
         self.listener = None
-        self.hotkey_active = False
+        # Listener.canonical, so left/right modifiers and shifted characters
+        # match the keys HotKey.parse produced
+        self._canonical = None
+        # Toggle state is the parity of a press counter: next() on
+        # itertools.count is a single atomic C-level step, so a press on the
+        # listener thread can't interleave with a read-modify-write.
+        self._toggle_count = itertools.count()
+        self._hotkey_active = False
+        # When False, presses of the dictation hotkey are ignored while
+        # secondary shortcuts keep working (e.g. before the model is ready)
+        self.toggle_enabled = True
+        self._last_press_ts = float("-inf")
+        self._key_error_count = 0
         self._hotkey = None
-
-        # Native event monitor (for bundled apps)
+        # HotKey.parse results by hotkey string, so flipping between hotkeys
+        # in Settings doesn't re-parse
+        self._parsed_hotkeys = {}
+        # Listener key -> key as HotKey.parse spelled it (e.g. Key.space -> KeyCode)
+        self._key_rewrite = {}
+        # Keys whose release matters; all other releases return immediately
+        self._release_keys = frozenset()
+        # Extra shortcuts sharing this listener (see register_secondary):
+        # pynput HotKeys, their keys, and native keycode -> [(mod mask, callback)]
+        self._secondary_hotkeys = ()
+        self._secondary_keys = frozenset()
+        self._secondary_native = {}
+        # Guards _hotkey bindings during remap; key callbacks only try-acquire
+        self._hotkey_lock = threading.Lock()
+
+        # User callbacks run on a worker thread so the key event source
+        # (pynput listener thread or native monitor) returns immediately.
+        self._cb_queue = queue.Queue(maxsize=CALLBACK_QUEUE_SIZE)
+        self._cb_worker_thread = None
+
+        # Native event monitor (default on macOS). Events are delivered on the
+        # app's main run loop, so there is no extra listener thread relaying
+        # every keystroke; pynput is only used as a fallback. Callers without
+        # a Cocoa run loop should pass use_native=False.
         self._native_monitor = None
-        self._use_native = _is_bundled and sys.platform == "darwin"
-
-        # Track modifier keys for combination detection
-        self.cmd_pressed = False
-        self.ctrl_pressed = False
-        self.alt_pressed = False
-        self.shift_pressed = False
+        if use_native is None:
+            use_native = sys.platform == "darwin"
+        self._use_native = use_native
 
         # Parse hotkey for native monitoring
         self._target_key = None
         self._target_modifiers = set()
+        self._target_keycode = -1
+        self._target_mod_mask = 0
 
         # Check accessibility permissions on macOS
         self._check_accessibility_permissions()
         self._configure_hotkey()
         self._parse_hotkey_for_native()
 
-    def _normalize_hotkey_key(self, key):
-        """Normalize keys so HotKey matching works across pynput variants."""
-        if self._hotkey is None:
-            return key
-        if key == keyboard.Key.space:
-            if hasattr(self._hotkey, "_keys"):
-                hotkey_keys = self._hotkey._keys
-                space_match = None
-                for hotkey_key in hotkey_keys:
-                    if isinstance(hotkey_key, keyboard.KeyCode):
-                        if getattr(hotkey_key, "char", None) == " ":
-                            space_match = hotkey_key
-                            break
-                        if getattr(hotkey_key, "vk", None) == 49:
-                            space_match = hotkey_key
-                            break
-                hotkey_has_key = any(hotkey_key == key for hotkey_key in hotkey_keys)
-                if space_match is not None and not hotkey_has_key:
-                    return space_match
-        return key
+    @staticmethod
+    def _find_space_replacement(hotkey_keys):
+        """
+        Return the KeyCode the hotkey uses for space, if it differs from Key.space.
+
+        Some pynput variants parse '<space>' as a KeyCode (char ' ' or vk 49)
+        while the listener reports Key.space, so presses need remapping.
+        """
+        if _KEY_SPACE in hotkey_keys:
+            return None
+        for hotkey_key in hotkey_keys:
+            if isinstance(hotkey_key, keyboard.KeyCode):
+                if getattr(hotkey_key, "char", None) == " ":
+                    return hotkey_key
+                if getattr(hotkey_key, "vk", None) == 49:
+                    return hotkey_key
+        return None
 
     def _configure_hotkey(self):
-        """Parse the hotkey string into a pynput HotKey object for generic matching."""
+        """
+        Parse the hotkey string into a pynput HotKey object for generic matching.
+
+        On remap the existing HotKey is rebound in place under _hotkey_lock, so
+        the running listener never routes events to a stale object.
+        """
+        hotkey_parts = self._parsed_hotkeys.get(self.hotkey_str)
         try:
-            hotkey_parts = keyboard.HotKey.parse(self.hotkey_str)
-            self._hotkey = keyboard.HotKey(hotkey_parts, self.on_press)
-            print(f"HOTKEY_MANAGER: Parsed hotkey '{self.hotkey_str}' into HotKey bindings.")
+            if hotkey_parts is None:
+                hotkey_parts = keyboard.HotKey.parse(self.hotkey_str)
+                self._parsed_hotkeys[self.hotkey_str] = hotkey_parts
         except Exception as e:
-            self._hotkey = None
-            print(f"HOTKEY_MANAGER: Failed to parse hotkey '{self.hotkey_str}': {e}")
+            with self._hotkey_lock:
+                self._hotkey = None
+                self._key_rewrite = {}
+                self._release_keys = frozenset()
+            logger.warning("HOTKEY_MANAGER: Failed to parse hotkey '%s': %s", self.hotkey_str, e)
+            return
+
+        with self._hotkey_lock:
+            if self._hotkey is None:
+                self._hotkey = keyboard.HotKey(hotkey_parts, self.on_press)
+            else:
+                self._hotkey._keys = set(hotkey_parts)
+                self._hotkey._state = set()
+            space_replacement = self._find_space_replacement(
+                getattr(self._hotkey, "_keys", ())
+            )
+            self._key_rewrite = (
+                {_KEY_SPACE: space_replacement} if space_replacement is not None else {}
+            )
+            self._release_keys = frozenset(hotkey_parts).union(
+                self._key_rewrite, self._secondary_keys
+            )
+        logger.info("HOTKEY_MANAGER: Parsed hotkey '%s' into HotKey bindings.", self.hotkey_str)
 
     def _parse_hotkey_for_native(self):
         """Parse hotkey string for native macOS event monitoring."""
         # Parse hotkey like '<ctrl>+<shift>+d' into components
-        parts = self.hotkey_str.lower().replace('>', '').split('+')
-        self._target_modifiers = set()
-        self._target_key = None
+        self._target_key, self._target_modifiers = _parse_native_combo(self.hotkey_str)
+
+        # Precompute integer match values for the per-event handler
+        self._target_keycode = KEY_NAME_TO_CODE.get(self._target_key, -1)
+        self._target_mod_mask = _modifier_mask(self._target_modifiers)
+
+        logger.info("HOTKEY_MANAGER: Native hotkey parsed - key='%s', modifiers=%s",
+                    self._target_key, self._target_modifiers)
+
+    def register_secondary(self, hotkey_str, on_trigger):
+        """
+        Fire on_trigger when hotkey_str is pressed, using this manager's listener.
+
+        Secondary shortcuts (e.g. Cmd+, for Settings) share the native monitor
+        or pynput listener instead of installing another global key hook.
+        They don't toggle dictation state and aren't debounced. on_trigger
+        runs on the callback worker like on_activate.
+
+        Returns:
+            True if the shortcut was registered.
+        """
+        try:
+            hotkey_parts = keyboard.HotKey.parse(hotkey_str)
+        except Exception as e:
+            logger.warning("HOTKEY_MANAGER: Failed to parse secondary hotkey '%s': %s", hotkey_str, e)
+            return False
 
-        for part in parts:
-            part = part.strip().strip('<')
-            if part in ('cmd', 'command'):
-                self._target_modifiers.add('cmd')
-            elif part in ('ctrl', 'control'):
-                self._target_modifiers.add('ctrl')
-            elif part in ('alt', 'option'):
-                self._target_modifiers.add('alt')
-            elif part in ('shift',):
-                self._target_modifiers.add('shift')
-            elif len(part) == 1:
-                # Single character key
-                self._target_key = part
-            elif part == 'space':
-                self._target_key = 'space'
-            elif part.startswith('f') and part[1:].isdigit():
-                # Function key like f9
-                self._target_key = part
-
-        print(f"HOTKEY_MANAGER: Native hotkey parsed - key='{self._target_key}', modifiers={self._target_modifiers}")
+        def trigger():
+            logger.info("HOTKEY_MANAGER: Secondary hotkey %s pressed", hotkey_str)
+            self._dispatch(on_trigger)
+
+        key, modifiers = _parse_native_combo(hotkey_str)
+        keycode = KEY_NAME_TO_CODE.get(key)
+        if keycode is not None:
+            bindings = self._secondary_native.setdefault(keycode, [])
+            bindings.append((_modifier_mask(modifiers), trigger))
+
+        with self._hotkey_lock:
+            self._secondary_hotkeys += (keyboard.HotKey(hotkey_parts, trigger),)
+            self._secondary_keys = self._secondary_keys.union(hotkey_parts)
+            self._release_keys = self._release_keys.union(hotkey_parts)
+        logger.info("HOTKEY_MANAGER: Registered secondary hotkey '%s'", hotkey_str)
+        return True
 
     def _check_accessibility_permissions(self):
         """Check if the app has accessibility permissions on macOS using native API."""
         if sys.platform != "darwin":
             return True
+        if HotkeyManager._ax_trusted_cache is not None:
+            return HotkeyManager._ax_trusted_cache
 
         try:
             from ApplicationServices import AXIsProcessTrusted
-            is_trusted = AXIsProcessTrusted()
+            is_trusted = bool(AXIsProcessTrusted())
+            HotkeyManager._ax_trusted_cache = is_trusted
             if is_trusted:
-                print("HOTKEY_MANAGER: Accessibility permissions granted.")
+                logger.info("HOTKEY_MANAGER: Accessibility permissions granted.")
                 return True
             else:
-                print("HOTKEY_MANAGER: WARNING - Accessibility permissions NOT granted.")
-                print("HOTKEY_MANAGER: Please grant in System Settings > Privacy & Security > Accessibility")
+                logger.warning("HOTKEY_MANAGER: WARNING - Accessibility permissions NOT granted.")
+                logger.warning("HOTKEY_MANAGER: Please grant in System Settings > Privacy & Security > Accessibility")
                 return False
         except ImportError:
             # Fallback if ApplicationServices not available
-            print("HOTKEY_MANAGER: Could not check accessibility permissions (API unavailable)")
+            logger.info("HOTKEY_MANAGER: Could not check accessibility permissions (API unavailable)")
             return True
         except Exception as e:
-            print(f"HOTKEY_MANAGER: Error checking accessibility permissions: {e}")
+            logger.error("HOTKEY_MANAGER: Error checking accessibility permissions: %s", e)
             return False
 
+    @classmethod
+    def clear_accessibility_cache(cls):
+        """Forget the cached permission check, e.g. after prompting the user."""
+        cls._ax_trusted_cache = None
+
+    @property
+    def hotkey_active(self):
+        """Whether the last hotkey press activated dictation."""
+        return self._hotkey_active
+
+    @hotkey_active.setter
+    def hotkey_active(self, value):
+        # Re-seed the counter so the next press toggles away from `value`
+        self._toggle_count = itertools.count(1 if value else 0)
+        self._hotkey_active = bool(value)
+
     def on_press(self):
         # This function will be registered with GlobalHotKeys
         # and called when the hotkey combination is pressed.
         # We will toggle the active state here.
         try:
-            print(f"HOTKEY_MANAGER: Hotkey {self.hotkey_str} pressed! Current state: {self.hotkey_active}")
-            if self.hotkey_active:
-                print("Hotkey deactivated")
-                self.on_deactivate()
-                self.hotkey_active = False
+            if not self.toggle_enabled:
+                logger.info("HOTKEY_MANAGER: Hotkey %s pressed before dictation is available, ignoring",
+                            self.hotkey_str)
+                return
+            now = time.monotonic()
+            if now - self._last_press_ts < PRESS_DEBOUNCE_SECONDS:
+                return
+            self._last_press_ts = now
+
+            activate = next(self._toggle_count) % 2 == 0
+            self._hotkey_active = activate
+            if activate:
+                logger.info("HOTKEY_MANAGER: Hotkey %s pressed - activated", self.hotkey_str)
+                dispatched = self._dispatch(self.on_activate)
             else:
-                print("Hotkey activated")
-                self.on_activate()
-                self.hotkey_active = True
+                logger.info("HOTKEY_MANAGER: Hotkey %s pressed - deactivated", self.hotkey_str)
+                dispatched = self._dispatch(self.on_deactivate)
+            if not dispatched:
+                # The callback never ran, so the app didn't change state either
+                self.hotkey_active = not activate
         except Exception as e:
-            print(f"HOTKEY_MANAGER: Error in on_press: {e}")
-            traceback.print_exc()
+            logger.error("HOTKEY_MANAGER: Error in on_press: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
+
+    def _dispatch(self, callback):
+        """
+        Hand a user callback to the worker thread (or run it inline if none).
+
+        Returns:
+            False if the press was dropped because the queue is full.
+        """
+        if self._cb_worker_thread is None:
+            callback()
+            return True
+        try:
+            self._cb_queue.put_nowait(callback)
+            return True
+        except queue.Full:
+            logger.warning("HOTKEY_MANAGER: Callback queue full, dropping hotkey press")
+            return False
+
+    def _cb_worker(self):
+        """Run queued activate/deactivate callbacks until told to stop."""
+        while True:
+            callback = self._cb_queue.get()
+            if callback is _STOP_WORKER:
+                return
+            try:
+                callback()
+            except Exception as e:
+                logger.error("HOTKEY_MANAGER: Error in hotkey callback: %s", e,
+                             exc_info=logger.isEnabledFor(logging.DEBUG))
+
+    def _start_callback_worker(self):
+        if self._cb_worker_thread is not None and self._cb_worker_thread.is_alive():
+            return
+        self._cb_worker_thread = threading.Thread(
+            target=self._cb_worker, name="HotkeyCallbacks", daemon=True
+        )
+        self._cb_worker_thread.start()
+
+    def _stop_callback_worker(self):
+        thread = self._cb_worker_thread
+        if thread is None:
+            return
+        self._cb_worker_thread = None
+        # Discard anything still pending so the sentinel always fits
+        while True:
+            try:
+                self._cb_queue.get_nowait()
+            except queue.Empty:
+                break
+        self._cb_queue.put_nowait(_STOP_WORKER)
+        thread.join(timeout=1.0)
 
     def _handle_native_event(self, event):
         """Handle native macOS keyboard events from NSEvent monitor."""
         try:
-            from Quartz import (
-                NSEventTypeKeyDown,
-                NSEventTypeKeyUp,
-                NSEventTypeFlagsChanged,
-            )
-
-            event_type = event.type()
-            key_code = event.keyCode()
-            flags = event.modifierFlags()
-
-            # Check current modifier state from event flags
-            cmd_down = bool(flags & NSEventModifierFlagCommand)
-            ctrl_down = bool(flags & NSEventModifierFlagControl)
-            alt_down = bool(flags & NSEventModifierFlagOption)
-            shift_down = bool(flags & NSEventModifierFlagShift)
-
-            if event_type == NSEventTypeKeyDown:
-                # Get the key name from keycode
-                key_name = MACOS_KEY_CODES.get(key_code)
-
-                if key_name and key_name == self._target_key:
-                    # Check if modifiers match
-                    current_mods = set()
-                    if cmd_down:
-                        current_mods.add('cmd')
-                    if ctrl_down:
-                        current_mods.add('ctrl')
-                    if alt_down:
-                        current_mods.add('alt')
-                    if shift_down:
-                        current_mods.add('shift')
-
-                    if current_mods == self._target_modifiers:
-                        print(f"HOTKEY_MANAGER: Native hotkey matched! key={key_name}, mods={current_mods}")
-                        self.on_press()
+            # The monitor only delivers KeyDown events, so match on precomputed
+            # ints. Nearly every keystroke fails the keycode tests and leaves
+            # here before the modifier flags are even fetched.
+            keycode = event.keyCode()
+            if keycode == self._target_keycode:
+                if (event.modifierFlags() & MOD_ANY_MASK) == self._target_mod_mask:
+                    logger.debug("HOTKEY_MANAGER: Native hotkey matched! key=%s, mods=%s",
+                                 self._target_key, self._target_modifiers)
+                    self.on_press()
+                    return
+            bindings = self._secondary_native.get(keycode)
+            if bindings:
+                mods = event.modifierFlags() & MOD_ANY_MASK
+                for mod_mask, trigger in bindings:
+                    if mods == mod_mask:
+                        trigger()
 
         except Exception as e:
-            print(f"HOTKEY_MANAGER: Error in native event handler: {e}")
-            traceback.print_exc()
+            logger.error("HOTKEY_MANAGER: Error in native event handler: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
 
     def start_listening(self):
-        import sys as _sys
         try:
-            print(f"Starting hotkey listener for {self.hotkey_str}...")
-            _sys.stdout.flush()
+            logger.info("Starting hotkey listener for %s...", self.hotkey_str)
+            self._start_callback_worker()
 
             # Validate hotkey format for macOS
             if sys.platform == "darwin" and "<fn>" in self.hotkey_str:
-                print("HOTKEY_MANAGER: WARNING - Function key (fn) combinations may not work reliably on macOS")
-                print("HOTKEY_MANAGER: Consider using <cmd>, <alt>, <ctrl>, or <shift> instead")
+                logger.warning("HOTKEY_MANAGER: WARNING - Function key (fn) combinations may not work reliably on macOS")
+                logger.warning("HOTKEY_MANAGER: Consider using <cmd>, <alt>, <ctrl>, or <shift> instead")
 
-            # Use native NSEvent monitoring for bundled apps on macOS
+            # Prefer native NSEvent monitoring on macOS
             if self._use_native:
-                print("HOTKEY_MANAGER: Using native NSEvent monitoring (bundled app mode)")
-                _sys.stdout.flush()
+                if self._native_monitor:
+                    logger.info("HOTKEY_MANAGER: Native event monitor already installed")
+                    return
+                logger.info("HOTKEY_MANAGER: Using native NSEvent monitoring")
                 try:
-                    from Quartz import (
-                        NSEvent,
-                        NSEventMaskKeyDown,
-                        NSEventMaskFlagsChanged,
-                    )
+                    if NSEvent is None:
+                        raise ImportError("Quartz is not available")
 
-                    # Monitor key down and modifier changes
-                    mask = NSEventMaskKeyDown | NSEventMaskFlagsChanged
+                    # Key down only: modifier state is read from the event's
+                    # flags, so FlagsChanged events would just be discarded
+                    mask = NSEventMaskKeyDown
 
                     self._native_monitor = NSEvent.addGlobalMonitorForEventsMatchingMask_handler_(
                         mask,
@@ -251,73 +466,75 @@ class HotkeyManager:
                     )
 
                     if self._native_monitor:
-                        print("HOTKEY_MANAGER: Native event monitor installed successfully")
+                        logger.info("HOTKEY_MANAGER: Native event monitor installed successfully")
                     else:
-                        print("HOTKEY_MANAGER: WARNING - Native monitor returned None (check accessibility permissions)")
-                    _sys.stdout.flush()
+                        logger.warning("HOTKEY_MANAGER: WARNING - Native monitor returned None (check accessibility permissions)")
                     return
                 except ImportError as ie:
-                    print(f"HOTKEY_MANAGER: Quartz import failed, falling back to pynput: {ie}")
+                    logger.warning("HOTKEY_MANAGER: Quartz import failed, falling back to pynput: %s", ie)
                     self._use_native = False
                 except Exception as native_error:
-                    print(f"HOTKEY_MANAGER: Native monitoring failed, falling back to pynput: {native_error}")
-                    traceback.print_exc()
+                    logger.warning("HOTKEY_MANAGER: Native monitoring failed, falling back to pynput: %s",
+                                   native_error, exc_info=True)
                     self._use_native = False
 
-            # Fall back to pynput listener (for development/unbundled mode)
-            print("HOTKEY_DEBUG: Starting pynput key listener...")
-            _sys.stdout.flush()
+            # Fall back to pynput listener (non-macOS or native monitor unavailable)
+            if self.listener is not None and self.listener.is_alive():
+                # pynput's Listener is a Thread; don't stack a second one
+                logger.info("HOTKEY_MANAGER: pynput key listener already running")
+                return
+            logger.info("HOTKEY_MANAGER: Starting pynput key listener...")
             try:
-                print("HOTKEY_DEBUG: Creating Listener object...")
-                _sys.stdout.flush()
+                # Listen-only: no suppression and no darwin_intercept hook, so
+                # pynput's event tap never calls back into Python to rewrite
+                # events (see "Platform specific options" in the pynput docs)
                 self.listener = keyboard.Listener(
                     on_press=self._on_key_press_with_hotkey_detection,
-                    on_release=self._on_key_release_with_hotkey_detection
+                    on_release=self._on_key_release_with_hotkey_detection,
+                    suppress=False,
+                    darwin_intercept=None,
                 )
-                print("HOTKEY_DEBUG: Listener created, calling start()...")
-                _sys.stdout.flush()
+                self._canonical = getattr(self.listener, "canonical", None)
                 self.listener.start()
-                print("HOTKEY_DEBUG: pynput key listener started successfully")
-                _sys.stdout.flush()
+                logger.info("HOTKEY_MANAGER: pynput key listener started successfully")
             except Exception as debug_error:
-                print(f"HOTKEY_DEBUG: Failed to start pynput listener: {debug_error}")
-                _sys.stdout.flush()
+                logger.error("HOTKEY_MANAGER: Failed to start pynput listener: %s", debug_error)
 
         except Exception as e:
-            print(f"HOTKEY_MANAGER: Error starting listener: {e}")
-            print("HOTKEY_MANAGER: This might be due to:")
-            print("  1. Missing accessibility permissions")
-            print("  2. Invalid hotkey format")
-            print("  3. Conflicting system hotkeys")
-            traceback.print_exc()
+            logger.error("HOTKEY_MANAGER: Error starting listener: %s", e)
+            logger.error("HOTKEY_MANAGER: This might be due to:")
+            logger.error("  1. Missing accessibility permissions")
+            logger.error("  2. Invalid hotkey format")
+            logger.error("  3. Conflicting system hotkeys", exc_info=True)
 
     def stop_listening(self):
         try:
             # Stop native monitor if active
             if self._native_monitor:
-                print("Stopping native event monitor...")
+                logger.info("Stopping native event monitor...")
                 try:
-                    from Quartz import NSEvent
                     NSEvent.removeMonitor_(self._native_monitor)
                     self._native_monitor = None
-                    print("Native event monitor stopped.")
+                    logger.info("Native event monitor stopped.")
                 except Exception as e:
-                    print(f"HOTKEY_MANAGER: Error stopping native monitor: {e}")
+                    logger.error("HOTKEY_MANAGER: Error stopping native monitor: %s", e)
 
             # Stop pynput listener if active
             if self.listener:
-                print("Stopping pynput hotkey listener...")
+                logger.info("Stopping pynput hotkey listener...")
+                # No join: stop() is enough for the listener thread to exit, and
+                # joining while pynput tears down its event tap can hang the
+                # caller (usually the main thread) on macOS
                 self.listener.stop()
-                # Don't join - let it stop asynchronously to avoid blocking issues
-                # self.listener.join()
                 self.listener = None
-                print("Hotkey listener stopped.")
+                logger.info("Hotkey listener stopped.")
+
+            self._stop_callback_worker()
 
             if not self._native_monitor and not self.listener:
-                print("HOTKEY_MANAGER: All listeners stopped")
+                logger.info("HOTKEY_MANAGER: All listeners stopped")
         except Exception as e:
-            print(f"HOTKEY_MANAGER: Error stopping listener: {e}")
-            traceback.print_exc()
+            logger.exception("HOTKEY_MANAGER: Error stopping listener: %s", e)
 
     def update_hotkey(self, new_hotkey_str: str) -> bool:
         """
@@ -328,80 +545,85 @@ class HotkeyManager:
         update that object.
         """
         try:
-            print(f"HOTKEY_MANAGER: Updating hotkey from '{self.hotkey_str}' to '{new_hotkey_str}'")
+            logger.info("HOTKEY_MANAGER: Updating hotkey from '%s' to '%s'", self.hotkey_str, new_hotkey_str)
 
             # Update the hotkey string
             self.hotkey_str = new_hotkey_str
             self.hotkey_active = False  # Reset toggle state
 
-            # Reconfigure the HotKey object (for pynput fallback)
+            # Rebind the HotKey object in place (for pynput fallback)
             self._configure_hotkey()
 
             # Re-parse for native monitoring (in case we're using that)
             self._parse_hotkey_for_native()
 
-            print(f"HOTKEY_MANAGER: Hotkey updated successfully to '{new_hotkey_str}'")
+            logger.info("HOTKEY_MANAGER: Hotkey updated successfully to '%s'", new_hotkey_str)
             return True
         except Exception as e:
-            print(f"HOTKEY_MANAGER: Failed to update hotkey: {e}")
-            traceback.print_exc()
+            logger.exception("HOTKEY_MANAGER: Failed to update hotkey: %s", e)
             return False
 
+    def _log_key_error(self, phase, error):
+        """Log key-callback failures, rate-limited so a repeating error can't flood the log."""
+        self._key_error_count += 1
+        if (self._key_error_count - 1) % KEY_ERROR_LOG_EVERY == 0:
+            logger.error("HOTKEY_DEBUG: Error in key %s detection (%d so far): %s",
+                         phase, self._key_error_count, error,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
+
     def _on_key_press_with_hotkey_detection(self, key):
         """Combined debug and hotkey detection"""
-        try:
-            print(f"HOTKEY_DEBUG: Key pressed: {key}")
-            if hasattr(key, 'vk') and key.vk:
-                print(f"HOTKEY_DEBUG: Virtual key code: {key.vk}")
-            
-            # Track modifier keys
-            if key == keyboard.Key.cmd:
-                self.cmd_pressed = True
-                print("HOTKEY_DEBUG: Command key pressed")
-            elif key == keyboard.Key.ctrl:
-                self.ctrl_pressed = True
-                print("HOTKEY_DEBUG: Control key pressed") 
-            elif key == keyboard.Key.alt:
-                self.alt_pressed = True
-                print("HOTKEY_DEBUG: Alt key pressed")
-            elif key == keyboard.Key.shift:
-                self.shift_pressed = True
-                print("HOTKEY_DEBUG: Shift key pressed")
-            
-            if self._hotkey is not None:
-                normalized_key = self._normalize_hotkey_key(key)
-                self._hotkey.press(normalized_key)
-                
-        except Exception as e:
-            print(f"HOTKEY_DEBUG: Error in key press detection: {e}")
+        logger.debug("HOTKEY_DEBUG: Key pressed: %s", key)
+
+        canonical = self._canonical
+        if canonical is not None:
+            key = canonical(key)
+
+        # Report keys the way this pynput variant parsed them. Only space is
+        # ever rewritten, so every other key skips the dict probe.
+        if key is _KEY_SPACE:
+            key = self._key_rewrite.get(key, key)
+
+        # Never block the listener thread: skip the key if a remap is in
+        # progress (the HotKey state is reset by the remap anyway)
+        if self._hotkey is not None and self._hotkey_lock.acquire(blocking=False):
+            # An exception escaping this callback stops the pynput listener
+            try:
+                self._hotkey.press(key)
+                for secondary in self._secondary_hotkeys:
+                    secondary.press(key)
+            except Exception as e:
+                self._log_key_error("press", e)
+            finally:
+                self._hotkey_lock.release()
 
     def _on_key_release_with_hotkey_detection(self, key):
         """Combined debug and hotkey release detection"""
-        try:
-            print(f"HOTKEY_DEBUG: Key released: {key}")
-            
-            # Track modifier key releases
-            if key == keyboard.Key.cmd:
-                self.cmd_pressed = False
-                print("HOTKEY_DEBUG: Command key released")
-            elif key == keyboard.Key.ctrl:
-                self.ctrl_pressed = False
-                print("HOTKEY_DEBUG: Control key released")
-            elif key == keyboard.Key.alt:
-                self.alt_pressed = False
-                print("HOTKEY_DEBUG: Alt key released")
-            elif key == keyboard.Key.shift:
-                self.shift_pressed = False
-                print("HOTKEY_DEBUG: Shift key released")
-                
-            if self._hotkey is not None:
-                normalized_key = self._normalize_hotkey_key(key)
-                self._hotkey.release(normalized_key)
-
-        except Exception as e:
-            print(f"HOTKEY_DEBUG: Error in key release detection: {e}")
+        # HotKey only needs releases of its own keys to re-arm, so ordinary
+        # typing skips the lock below
+        canonical = self._canonical
+        if canonical is not None:
+            key = canonical(key)
+        if key not in self._release_keys:
+            return
+        logger.debug("HOTKEY_DEBUG: Key released: %s", key)
+
+        if key is _KEY_SPACE:
+            key = self._key_rewrite.get(key, key)
+
+        if self._hotkey is not None and self._hotkey_lock.acquire(blocking=False):
+            try:
+                self._hotkey.release(key)
+                for secondary in self._secondary_hotkeys:
+                    secondary.release(key)
+            except Exception as e:
+                self._log_key_error("release", e)
+            finally:
+                self._hotkey_lock.release()
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     # Example Usage (for testing hotkey_manager.py directly)
     def handle_activation():
         print("Activation callback triggered!")
@@ -419,14 +641,16 @@ if __name__ == '__main__':
     print(f"Testing with hotkey: {test_hotkey}")
     print("Press the hotkey to test, or Ctrl+C to exit")
     
-    manager = HotkeyManager(test_hotkey, handle_activation, handle_deactivation)
+    # No Cocoa run loop here, so use the pynput listener instead of NSEvent
+    manager = HotkeyManager(test_hotkey, handle_activation, handle_deactivation, use_native=False)
     manager.start_listening()
 
     try:
         # Keep the main thread alive to allow the listener thread to run
         # In a real application, the main event loop (e.g., rumps) would do this.
-        while True:
-            pass
+        # Block without spinning until Ctrl+C; unlike signal.pause() this also
+        # works on platforms without POSIX signals.
+        threading.Event().wait()
     except KeyboardInterrupt:
         manager.stop_listening()
         print("Exiting example.") 
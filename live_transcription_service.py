@@ -8,8 +8,18 @@ transcribing accumulated audio to show preview text while the user speaks.
 import threading
 import time
 import numpy as np
+import torch
 from typing import Callable, Optional
 
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _result_text(result) -> str:
+    """Extract text from a NeMo transcribe() item (str or Hypothesis)."""
+    if isinstance(result, str):
+        return result
+    return getattr(result, 'text', None) or ""
+
 
 class LiveTranscriptionService:
     """
@@ -23,6 +33,8 @@ class LiveTranscriptionService:
 
     PREVIEW_INTERVAL = 2.0  # Seconds between preview transcriptions
     MIN_AUDIO_LENGTH = 0.5  # Minimum audio seconds before previewing
+    PREVIEW_WINDOW_SECONDS = 15.0  # Trailing audio transcribed per preview
+    INITIAL_BUFFER_SECONDS = 60  # Preallocated audio; doubles when exceeded
 
     def __init__(
         self,
@@ -43,14 +55,47 @@ class LiveTranscriptionService:
         self._sample_rate = sample_rate
 
         self._is_active = False
-        self._audio_buffer: list[np.ndarray] = []
-        self._buffer_lock = threading.Lock()
+        # Accumulated audio lives in one preallocated array; _write is the
+        # number of valid samples, so previews never concatenate chunk lists.
+        # Single producer (the audio thread) and single consumer (the preview
+        # thread), so no lock: the producer fills samples (swapping in a grown
+        # array first if needed) and only then publishes the new _write, and
+        # the consumer reads _write before _buf. Attribute stores are atomic
+        # under the GIL, so any _buf seen holds at least _write samples.
+        self._buf = self._new_buffer()
+        self._write = 0
+        self._preview_cursor = 0  # _write as of the last preview
         self._preview_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
 
+        # Model reference and its lock, snapshotted in start() for the preview thread
+        self._asr_model_ref = None
+        self._model_lock = None
+
         # Track last preview to avoid duplicate callbacks
         self._last_preview_text = ""
 
+        # Latest preview waiting for the main thread; at most one UI dispatch
+        # is queued, and it delivers whatever text is newest when it runs
+        self._pending_preview: Optional[str] = None
+        self._ui_pending = False
+
+    def _new_buffer(self) -> np.ndarray:
+        """Allocate an empty audio buffer of the initial capacity."""
+        return np.empty(self._sample_rate * self.INITIAL_BUFFER_SECONDS, dtype=np.int16)
+
+    def _reset_buffer(self):
+        """
+        Drop accumulated audio by swapping in a fresh buffer.
+
+        The old array is never rewritten, so a preview still holding a view
+        of it keeps valid samples. Only call this while no chunks are being
+        added (before recording starts or after it stops).
+        """
+        self._buf = self._new_buffer()
+        self._write = 0
+        self._preview_cursor = 0
+
     @property
     def is_active(self):
         """Return whether the service is currently active."""
@@ -63,13 +108,22 @@ class LiveTranscriptionService:
             return
 
         print("LIVE_TRANSCRIPTION: Starting preview service")
+        # Reset before going active, while add_audio_chunk still ignores chunks
+        self._reset_buffer()
         self._is_active = True
-        self._stop_event.clear()
-        self._audio_buffer = []
+        # Fresh event per session: a preview thread left over from the previous
+        # session keeps its own (set) event and exits without publishing
+        self._stop_event = threading.Event()
         self._last_preview_text = ""
+        self._asr_model_ref = (
+            getattr(self._asr_service, 'asr_model', None)
+            if self._asr_service.is_model_loaded else None
+        )
+        self._model_lock = getattr(self._asr_service, 'model_lock', None)
 
         self._preview_thread = threading.Thread(
             target=self._preview_loop,
+            args=(self._stop_event,),
             name="LiveTranscriptionPreview"
         )
         self._preview_thread.daemon = True
@@ -84,17 +138,18 @@ class LiveTranscriptionService:
         self._is_active = False
         self._stop_event.set()
 
-        if self._preview_thread:
-            self._preview_thread.join(timeout=2.0)
-            self._preview_thread = None
+        # Don't join: stop() runs on the main thread and an in-flight preview
+        # can take seconds. It holds the ASR model lock, so the final
+        # transcription (and the next session's previews) wait for it rather
+        # than calling the model concurrently; the thread exits afterwards.
+        self._preview_thread = None
 
         # Clear buffer
-        with self._buffer_lock:
-            self._audio_buffer = []
+        self._reset_buffer()
 
     def add_audio_chunk(self, chunk: np.ndarray):
         """
-        Add audio chunk to preview buffer (thread-safe).
+        Add audio chunk to preview buffer (audio thread only).
 
         Args:
             chunk: Audio data as int16 numpy array.
@@ -102,77 +157,112 @@ class LiveTranscriptionService:
         if not self._is_active:
             return
 
-        # Convert int16 to float32
-        chunk_float = chunk.astype(np.float32) / 32768.0
-        if chunk_float.ndim > 1:
-            chunk_float = chunk_float.flatten()
-
-        with self._buffer_lock:
-            self._audio_buffer.append(chunk_float)
-
-    def _preview_loop(self):
+        samples = chunk.reshape(-1)  # View for (frames, 1) input, no copy
+        buf = self._buf
+        start = self._write
+        end = start + samples.size
+        if end > buf.size:
+            # Grow geometrically so appends stay amortised O(1)
+            grown = np.empty(max(end, 2 * buf.size), dtype=np.int16)
+            grown[:start] = buf[:start]
+            self._buf = buf = grown
+        # Stored as raw int16; conversion happens once per preview
+        buf[start:end] = samples
+        self._write = end  # Publish only after the samples are in place
+
+    def _preview_loop(self, stop_event: threading.Event):
         """Background thread that periodically triggers preview transcription."""
         print("LIVE_TRANSCRIPTION: Preview loop started")
 
-        while not self._stop_event.wait(timeout=self.PREVIEW_INTERVAL):
-            if not self._is_active:
-                break
-
-            with self._buffer_lock:
-                if not self._audio_buffer:
-                    continue
-
-                # Get copy of accumulated audio
-                try:
-                    audio = np.concatenate(self._audio_buffer)
-                except ValueError:
-                    # Empty buffer or invalid data
-                    continue
-
-            # Check minimum length
-            duration = len(audio) / self._sample_rate
-            if duration < self.MIN_AUDIO_LENGTH:
+        while not stop_event.wait(timeout=self.PREVIEW_INTERVAL):
+            audio = self._take_preview_audio()
+            if audio is None:
                 continue
 
             # Request preview transcription
-            self._request_preview_transcription(audio)
+            self._request_preview_transcription(audio, stop_event)
 
         print("LIVE_TRANSCRIPTION: Preview loop ended")
 
-    def _request_preview_transcription(self, audio: np.ndarray):
+    def _take_preview_audio(self) -> Optional[np.ndarray]:
+        """
+        Return the trailing preview window if at least MIN_AUDIO_LENGTH of
+        new audio arrived since the last preview.
+
+        Transcribing only the last PREVIEW_WINDOW_SECONDS keeps each preview's
+        cost bounded instead of growing with the length of the recording.
+        """
+        end = self._write  # Read before _buf; see __init__
+        # Cheap integer check first: during pauses nothing below runs
+        if end - self._preview_cursor < self.MIN_AUDIO_LENGTH * self._sample_rate:
+            return None
+        window = int(self.PREVIEW_WINDOW_SECONDS * self._sample_rate)
+        # A view is enough: samples before _write are never rewritten
+        # (growth and resets swap in a new array)
+        samples = self._buf[max(0, end - window):end]
+        self._preview_cursor = end
+
+        # Convert int16 to float32 in one pass over the window
+        return np.multiply(samples, _INT16_SCALE, dtype=np.float32)
+
+    def _request_preview_transcription(self, audio: np.ndarray, stop_event: threading.Event):
         """
         Request a preview transcription.
 
         This uses direct model access for preview to avoid interfering
-        with the main transcription queue.
+        with the main transcription queue. Results that finish after the
+        session was stopped are dropped.
         """
         try:
-            # Check if model is loaded and available
-            if not self._asr_service.is_model_loaded:
+            # Model captured at start(); None if it wasn't loaded yet
+            asr_model = self._asr_model_ref
+            model_lock = self._model_lock
+            if asr_model is None or model_lock is None:
                 return
 
-            asr_model = getattr(self._asr_service, 'asr_model', None)
-            if asr_model is None:
+            # Skip this preview if the model is busy (final transcription
+            # or warm-up); never block on it
+            if not model_lock.acquire(blocking=False):
                 return
-
-            # Direct model call for preview (not through queue)
-            import torch
-            with torch.no_grad():
-                results = asr_model.transcribe([audio], batch_size=1)
-                if results and len(results) > 0:
-                    text = results[0] if isinstance(results[0], str) else ""
-                    if text and text != self._last_preview_text:
-                        self._last_preview_text = text
-                        # Callback to UI (needs main thread dispatch)
-                        from PyObjCTools import AppHelper
-                        AppHelper.callAfter(self._on_preview, text)
-                        print(f"LIVE_TRANSCRIPTION: Preview updated: '{text[:50]}...'")
+            try:
+                # Direct model call for preview (not through queue)
+                with torch.inference_mode():
+                    # verbose=False skips NeMo's per-call tqdm progress bar
+                    results = asr_model.transcribe([audio], batch_size=1, verbose=False)
+            finally:
+                model_lock.release()
+
+            if results and len(results) > 0:
+                text = _result_text(results[0])
+                if stop_event.is_set():
+                    return
+                if text and text != self._last_preview_text:
+                    self._last_preview_text = text
+                    self._post_preview(text)
+                    print(f"LIVE_TRANSCRIPTION: Preview updated: '{text[:50]}...'")
 
         except Exception as e:
             print(f"LIVE_TRANSCRIPTION: Preview error: {e}")
 
+    def _post_preview(self, text: str):
+        """Hand the newest preview to the UI, coalescing with any queued one."""
+        self._pending_preview = text
+        if not self._ui_pending:
+            self._ui_pending = True
+            # Callback to UI (needs main thread dispatch)
+            from PyObjCTools import AppHelper
+            AppHelper.callAfter(self._flush_preview)
+
+    def _flush_preview(self):
+        """Deliver the pending preview text (runs on the main thread)."""
+        # Clear the flag before reading so a preview posted meanwhile
+        # schedules its own flush instead of being lost
+        self._ui_pending = False
+        text, self._pending_preview = self._pending_preview, None
+        if text:
+            self._on_preview(text)
+
     def clear_buffer(self):
-        """Clear the audio buffer."""
-        with self._buffer_lock:
-            self._audio_buffer = []
+        """Clear the audio buffer (only while no chunks are being added)."""
+        self._reset_buffer()
         self._last_preview_text = ""
@@ -14,8 +14,57 @@ if getattr(sys, "frozen", False):  # running inside YardTalk.app
 # ---------------------------------------------------------------------------
 
 # Set up file logging for GUI app debugging
+import atexit
 import logging
+import queue
+import logging.handlers
 import datetime
+import functools
+import itertools
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+# Logs are appended across launches and rotated at this size
+LOG_MAX_BYTES = 2 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+def _open_log_file(path):
+    """Append to path, rotating to path.1 .. path.3 past LOG_MAX_BYTES."""
+    return logging.handlers.RotatingFileHandler(
+        path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+    )
+
+# Records are handed to a QueueListener thread, so the file/console writes
+# never run on the thread that logged (often the AppKit main thread)
+_log_listener = None
+
+def _shutdown_logging():
+    """Drain queued log records into the log file."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+# NSApp terminate can exit without interpreter shutdown; quit_app calls it too
+atexit.register(_shutdown_logging)
+
+def _install_log_handlers(handlers):
+    """Route the root logger through a queue to the given handlers."""
+    global _log_listener
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # prepare() renders the message (and any traceback) once with this
+    # formatter; the listener's handlers add the timestamp/level prefix
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    # DEBUG only with YT_DEBUG set, matching hotkey_manager/correction_window,
+    # so isEnabledFor(DEBUG) guards skip their work in normal use
+    level = logging.DEBUG if os.environ.get("YT_DEBUG") else logging.INFO
+    logging.basicConfig(level=level, handlers=[queue_handler])
 
 # Create a log file in the user's home directory for GUI launches
 def _configure_logging():
@@ -23,37 +72,33 @@ def _configure_logging():
     handlers = [logging.StreamHandler(sys.stdout)]
     try:
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        handlers.insert(0, logging.FileHandler(log_file, mode='w'))
+        handlers.insert(0, _open_log_file(log_file))
     except Exception as file_error:
         fallback_path = "/tmp/yardtalk.log"
         try:
-            handlers.insert(0, logging.FileHandler(fallback_path, mode='w'))
+            handlers.insert(0, _open_log_file(fallback_path))
             log_file = fallback_path
         except Exception:
             log_file = None
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=handlers,
-        )
+        _install_log_handlers(handlers)
         if log_file:
             logging.warning("Logging file handler failed; using fallback path: %s", log_file)
         else:
             logging.warning("Logging file handler failed: %s", file_error)
         return
 
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=handlers,
-    )
+    _install_log_handlers(handlers)
 
 _configure_logging()
 
+# Bound once so log_print skips the logger lookup on every call
+_root_logger = logging.getLogger()
+_log_info = _root_logger.info
+
 def log_print(*args, **kwargs):
     """Custom print function that logs to both file and console"""
-    message = ' '.join(str(arg) for arg in args)
-    logging.info(message)
+    # Most call sites pass a single f-string; only join when there are several
+    _log_info(args[0] if len(args) == 1 else ' '.join(map(str, args)))
 
 # Replace print with our logging version
 print = log_print
@@ -62,7 +107,7 @@ import rumps
 from app_paths import resolve_resource_path, get_model_storage_dir
 # ui_config imports removed - using simple icon="icon.png" instead
 from hotkey_manager import HotkeyManager
-from audio_manager import AudioManager
+from audio_manager import AudioManager, chunk_sum_of_squares
 from asr_service import ASRService
 from text_insertion_service import TextInsertionService
 from overlay_window import OverlayWindow
@@ -72,9 +117,11 @@ from transcription_history import TranscriptionHistory
 from correction_window import CorrectionWindow
 from live_transcription_service import LiveTranscriptionService
 from transcription_result import TranscriptionResult
-from help_window import HelpWindow
 import sounddevice as sd
 from PyObjCTools import AppHelper
+import math
+from typing import Any, NamedTuple
+import threading
 import time
 import numpy as np
 
@@ -85,46 +132,47 @@ from AppKit import (
     NSWindow, NSView, NSTextField, NSColor, NSFont, NSScreen,
     NSWindowStyleMaskBorderless, NSBackingStoreBuffered,
     NSFloatingWindowLevel, NSWindowCollectionBehaviorCanJoinAllSpaces,
-    NSTextAlignmentCenter
+    NSTextAlignmentCenter, NSWorkspace
 )
-from Foundation import NSObject, NSRect, NSPoint, NSSize, NSTimer, NSRunLoop, NSDefaultRunLoopMode
+from Foundation import NSObject, NSRect, NSPoint, NSSize, NSThread, NSTimer, NSRunLoop, NSDefaultRunLoopMode, NSDate
 
 # Global reference to the app instance for menu callbacks
 _app_instance = None
 
-# Simple toast notification window
+# Simple toast notification window, built on first use and reused
+TOAST_WIDTH = 320
+TOAST_HEIGHT = 60
 _toast_window = None
+_toast_title_label = None
+_toast_msg_label = None
+# Bumped per toast so an older toast's dismiss timer can't hide a newer one
+_toast_generation = 0
 
-def _dismiss_toast():
+def _dismiss_toast(generation=None):
     """Dismiss the toast window."""
-    global _toast_window
-    if _toast_window:
+    if generation is not None and generation != _toast_generation:
+        return
+    if _toast_window and _toast_window.isVisible():
         _toast_window.orderOut_(None)
-        _toast_window = None
         print("MAIN_APP: Toast dismissed")
 
-def show_toast(title: str, message: str, duration: float = 2.5):
-    """Show a simple floating toast notification using AppKit."""
-    global _toast_window
-
-    # Cancel any existing toast
-    if _toast_window:
-        _toast_window.orderOut_(None)
-        _toast_window = None
-
-    # Create toast window
-    screen = NSScreen.mainScreen()
-    screen_frame = screen.frame() if screen else NSRect(NSPoint(0, 0), NSSize(1920, 1080))
-
-    toast_width = 320
-    toast_height = 60
-    x = (screen_frame.size.width - toast_width) / 2
-    y = screen_frame.size.height - 120  # Near top of screen
-
-    frame = NSRect(NSPoint(x, y), NSSize(toast_width, toast_height))
+def _make_toast_label(frame, font, color):
+    label = NSTextField.alloc().initWithFrame_(frame)
+    label.setBezeled_(False)
+    label.setDrawsBackground_(False)
+    label.setEditable_(False)
+    label.setSelectable_(False)
+    label.setTextColor_(color)
+    label.setFont_(font)
+    label.setAlignment_(NSTextAlignmentCenter)
+    return label
+
+def _build_toast_window():
+    """Create the borderless toast window with its title and message labels."""
+    global _toast_window, _toast_title_label, _toast_msg_label
 
     _toast_window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
-        frame,
+        NSRect(NSPoint(0, 0), NSSize(TOAST_WIDTH, TOAST_HEIGHT)),
         NSWindowStyleMaskBorderless,
         NSBackingStoreBuffered,
         False
@@ -133,50 +181,67 @@ def show_toast(title: str, message: str, duration: float = 2.5):
     _toast_window.setCollectionBehavior_(NSWindowCollectionBehaviorCanJoinAllSpaces)
     _toast_window.setOpaque_(False)
     _toast_window.setBackgroundColor_(NSColor.clearColor())
+    # Keep the window around after orderOut_ so the next toast can reuse it
+    _toast_window.setReleasedWhenClosed_(False)
 
     # Create content view with rounded background
-    content = NSView.alloc().initWithFrame_(NSRect(NSPoint(0, 0), NSSize(toast_width, toast_height)))
+    content = NSView.alloc().initWithFrame_(NSRect(NSPoint(0, 0), NSSize(TOAST_WIDTH, TOAST_HEIGHT)))
     content.setWantsLayer_(True)
     content.layer().setBackgroundColor_(NSColor.colorWithWhite_alpha_(0.15, 0.95).CGColor())
     content.layer().setCornerRadius_(12)
 
-    # Title label
-    title_frame = NSRect(NSPoint(15, 30), NSSize(toast_width - 30, 22))
-    title_label = NSTextField.alloc().initWithFrame_(title_frame)
-    title_label.setStringValue_(title)
-    title_label.setBezeled_(False)
-    title_label.setDrawsBackground_(False)
-    title_label.setEditable_(False)
-    title_label.setSelectable_(False)
-    title_label.setTextColor_(NSColor.whiteColor())
-    title_label.setFont_(NSFont.boldSystemFontOfSize_(14))
-    title_label.setAlignment_(NSTextAlignmentCenter)
-    content.addSubview_(title_label)
-
-    # Message label
-    msg_frame = NSRect(NSPoint(15, 10), NSSize(toast_width - 30, 18))
-    msg_label = NSTextField.alloc().initWithFrame_(msg_frame)
-    msg_label.setStringValue_(message)
-    msg_label.setBezeled_(False)
-    msg_label.setDrawsBackground_(False)
-    msg_label.setEditable_(False)
-    msg_label.setSelectable_(False)
-    msg_label.setTextColor_(NSColor.colorWithWhite_alpha_(1.0, 0.8))
-    msg_label.setFont_(NSFont.systemFontOfSize_(12))
-    msg_label.setAlignment_(NSTextAlignmentCenter)
-    content.addSubview_(msg_label)
+    _toast_title_label = _make_toast_label(
+        NSRect(NSPoint(15, 30), NSSize(TOAST_WIDTH - 30, 22)),
+        NSFont.boldSystemFontOfSize_(14),
+        NSColor.whiteColor(),
+    )
+    content.addSubview_(_toast_title_label)
+
+    _toast_msg_label = _make_toast_label(
+        NSRect(NSPoint(15, 10), NSSize(TOAST_WIDTH - 30, 18)),
+        NSFont.systemFontOfSize_(12),
+        NSColor.colorWithWhite_alpha_(1.0, 0.8),
+    )
+    content.addSubview_(_toast_msg_label)
 
     _toast_window.setContentView_(content)
+
+def show_toast(title: str, message: str, duration: float = 2.5):
+    """Show a simple floating toast notification using AppKit."""
+    global _toast_generation
+
+    if _toast_window is None:
+        _build_toast_window()
+
+    # Position near the top of the current main screen
+    screen = NSScreen.mainScreen()
+    screen_frame = screen.frame() if screen else NSRect(NSPoint(0, 0), NSSize(1920, 1080))
+    x = (screen_frame.size.width - TOAST_WIDTH) / 2
+    y = screen_frame.size.height - 120
+    _toast_window.setFrameOrigin_(NSPoint(x, y))
+
+    _toast_title_label.setStringValue_(title)
+    _toast_msg_label.setStringValue_(message)
     _toast_window.orderFrontRegardless()
 
     # Auto-dismiss using AppHelper.callLater
-    AppHelper.callLater(duration, _dismiss_toast)
+    _toast_generation += 1
+    AppHelper.callLater(duration, _dismiss_toast, _toast_generation)
     print(f"MAIN_APP: Toast shown: '{title}' - '{message}'")
 
 
+# Dock menu toggle titles, indexed by the _DOCK_* states
+_DOCK_IDLE, _DOCK_RECORDING, _DOCK_TRANSCRIBING = range(3)
+_DOCK_TOGGLE_TITLES = ("Start Dictation", "Stop Dictation", "Processing...")
+
+
 class AppMenuHandler(NSObject):
     """Handler for application menu items and Dock menu."""
 
+    # Dock menu, built on first request and reused
+    _dock_menu = None
+    _dock_toggle_item = None
+
     @objc.python_method
     def _get_app(self):
         global _app_instance
@@ -190,6 +255,7 @@ class AppMenuHandler(NSObject):
 
     def showHelp_(self, sender):
         """Handle Help menu click."""
+        from help_window import HelpWindow  # Rarely used; keep off the startup path
         HelpWindow.show_help()
 
     def toggleDictation_(self, sender):
@@ -216,15 +282,22 @@ class AppMenuHandler(NSObject):
 
     def applicationDockMenu_(self, sender):
         """Provide the Dock right-click menu."""
-        menu = NSMenu.alloc().init()
-
         # Toggle Dictation item
         app = self._get_app()
-        toggle_title = "Start Dictation"
-        if app and app.dictation_active:
-            toggle_title = "Stop Dictation"
-        elif app and app.is_transcribing:
-            toggle_title = "Processing..."
+        state = _DOCK_IDLE
+        if app:
+            if app.dictation_active:
+                state = _DOCK_RECORDING
+            elif app.is_transcribing:
+                state = _DOCK_TRANSCRIBING
+        toggle_title = _DOCK_TOGGLE_TITLES[state]
+
+        # AppKit asks on every right-click; build once, then only retitle
+        if self._dock_menu is not None:
+            self._dock_toggle_item.setTitle_(toggle_title)
+            return self._dock_menu
+
+        menu = NSMenu.alloc().init()
 
         toggle_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             toggle_title, "toggleDictation:", ""
@@ -242,6 +315,8 @@ class AppMenuHandler(NSObject):
         settings_item.setTarget_(self)
         menu.addItem_(settings_item)
 
+        self._dock_menu = menu
+        self._dock_toggle_item = toggle_item
         return menu
 
 
@@ -388,31 +463,63 @@ def find_parakeet_model(search_dir):
 
     Returns the path to the .nemo file, or None if not found.
     """
-    import glob
-    search_path = pathlib.Path(search_dir)
-
-    # Look for parakeet-tdt-* directories
-    model_dirs = sorted(search_path.glob("parakeet-tdt-*"), reverse=True)
+    # One directory listing; entries are split into model dirs and bare files
+    model_dirs = []
+    nemo_files = []
+    try:
+        with os.scandir(search_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith("parakeet-tdt-"):
+                    continue
+                if entry.is_dir():
+                    model_dirs.append(entry)
+                elif entry.name.endswith(".nemo"):
+                    nemo_files.append(entry)
+    except OSError:
+        return None
 
+    # Newest version first
+    model_dirs.sort(key=lambda entry: entry.name, reverse=True)
     for model_dir in model_dirs:
-        if model_dir.is_dir():
-            # Find .nemo file inside
-            nemo_files = list(model_dir.glob("*.nemo"))
-            if nemo_files:
-                return str(nemo_files[0])
+        # Find .nemo file inside
+        try:
+            with os.scandir(model_dir.path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".nemo"):
+                        return entry.path
+        except OSError:
+            continue
 
     # Also check for .nemo files directly in the search directory (for bundled app)
-    direct_nemo = sorted(search_path.glob("parakeet-tdt-*.nemo"), reverse=True)
-    if direct_nemo:
-        return str(direct_nemo[0])
+    if nemo_files:
+        return max(nemo_files, key=lambda entry: entry.name).path
 
     return None
 
 
+# Seconds to gather history additions into a single menu update
+HISTORY_MENU_DELAY = 0.1
+
+# Source apps that never take typed text; dictation into them is copied instead
+_NON_TEXT_BUNDLES = frozenset({"com.apple.finder", "com.apple.dock.extra", "com.apple.loginwindow"})
+
+# Longest wait for the source app to come frontmost before inserting text,
+# and the run loop slice used while polling for it
+FOCUS_SETTLE_TIMEOUT = 0.1
+FOCUS_POLL_INTERVAL = 0.01
+
 # Used to distinguish ASR service callbacks
 ASR_CALLBACK_TYPE_MODEL_LOAD = "model_load_status"
 ASR_CALLBACK_TYPE_TRANSCRIPTION = "transcription_result"
 
+
+class AsrEvent(NamedTuple):
+    """ASR service callback, handed from the worker thread to the main thread."""
+    kind: str  # ASR_CALLBACK_TYPE_*
+    result: Any  # Transcription result, or "loaded"/"error" for a model load
+    error: Any
+    log_id: str
+
 class DictationApp(rumps.App):
     def __init__(self):
         # Simple initialization that works (from commit 1fbd7e3)
@@ -420,6 +527,16 @@ class DictationApp(rumps.App):
         print(f"MAIN_APP: App initialized with icon='icon.png'")
         # Initialize transcription history (session only)
         self.transcription_history = TranscriptionHistory()
+        # Menu bar items built by setup_app_menu (None until it has run)
+        self._native_toggle_item = None
+        self._native_recent_menu = None
+        # Entries currently listed in the native Recent Transcriptions submenu
+        self._native_history_count = 0
+        # Entries added since the last menu update (see _flush_history_menu)
+        self._pending_history_entries = []
+        # rumps submenu items reused across rebuilds: id(entry) -> (entry, item)
+        self._rumps_history_items = {}
+        self._rumps_clear_history_item = None
 
         # Build menu with history submenu
         self.menu = [
@@ -431,12 +548,17 @@ class DictationApp(rumps.App):
             "Quit"
         ]
 
+        # Only ever written on the main thread (hotkey, ASR and UI callbacks are
+        # all marshalled there via AppHelper.callAfter); the audio thread just
+        # reads dictation_active. Plain attributes are enough, no locking needed.
         self.dictation_active = False
         self.is_transcribing = False
 
         # Initialize settings manager and load saved hotkey
         self.settings_manager = SettingsManager()
         self.hotkey_string = self.settings_manager.get_hotkey()
+        self._start_title = f"Start Dictation ({hotkey_to_display(self.hotkey_string)})"
+        self._menu_state = None  # Inputs behind the last toggle title update_menu_state applied
         self.preferences_window = None  # Lazy initialization
 
         # Initialize correction window for reviewing transcriptions
@@ -444,13 +566,18 @@ class DictationApp(rumps.App):
             on_send=self._on_correction_send,
             on_cancel=self._on_correction_cancel
         )
+        # Realize its views once the run loop starts so the first show() is fast
+        AppHelper.callAfter(self.correction_window.prewarm)
 
         # Silence detection settings for auto-send (loaded from settings manager)
         self.silence_threshold = self.settings_manager.get_silence_threshold()
+        self._silence_threshold_sq = self.silence_threshold * self.silence_threshold
         self.silence_auto_stop_enabled = self.settings_manager.get_silence_auto_stop_enabled()
         self.silence_duration = self.settings_manager.get_silence_duration()
         self.skip_edit_window = self.settings_manager.get_skip_edit_window()
-        self._last_sound_time = None  # Timestamp of last non-silent audio
+        # Silence timer runs on captured sample counts rather than wall-clock time
+        self._samples_seen = 0  # Frames received from the audio callback
+        self._last_sound_sample = None  # _samples_seen at last non-silent audio
         self._auto_stop_pending = False  # Prevent multiple auto-stops
         self._waiting_for_correction = False  # True while correction window is open
 
@@ -459,15 +586,24 @@ class DictationApp(rumps.App):
         # Flag to ensure MODEL_LOADED_SUCCESSFULLY is handled only once
         self._model_loaded_handled = False
         self._hotkeys_started = False  # Track whether hotkeys have been started
-        self.active_timers = [] # Add a list to keep track of active timers
+        self.active_timers = set() # Keep pending ASR result timers alive until they fire
+        self._workspace = NSWorkspace.sharedWorkspace()  # Used to capture the source app per dictation
         self._last_transcribed_text = None  # Remember the last text we actually typed
         self.update_menu_state()
-        self._debug_id_counter = 0 # For generating unique log IDs
+        # Sequential log IDs; count.__next__ is atomic, so the ASR thread can share it
+        self._next_log_id = itertools.count(1).__next__
 
         # Initialize services
         self.audio_manager = AudioManager()
+        self.sample_rate = self.audio_manager.sample_rate
         self.text_insertion_service = TextInsertionService()
         self.overlay_window = OverlayWindow()
+        # The waveform converts and buffers every sample, so it is fed from
+        # its own thread rather than inline on the audio read loop
+        self._overlay_chunks = queue.SimpleQueue()
+        threading.Thread(
+            target=self._overlay_feed_loop, name="OverlayFeed", daemon=True
+        ).start()
 
         # Pre-warm audio subsystem in background to avoid first-recording delays
         print("MAIN_APP: Starting audio subsystem pre-warm...")
@@ -496,30 +632,34 @@ class DictationApp(rumps.App):
         # Check and request accessibility permissions before initializing hotkey manager
         self._check_and_request_accessibility()
 
-        # Initialize hotkey manager but don't start it yet
+        # Listen right away so Cmd+, works during model download/load, but keep
+        # the dictation hotkey disabled until the subsystems are ready
         self.hotkey_manager = HotkeyManager(
             hotkey_str=self.hotkey_string,
             on_activate=self.request_activate_dictation,
             on_deactivate=self.request_deactivate_dictation
         )
-        
-        # Start hotkey manager only when both ASR and audio subsystems are ready
+        self.hotkey_manager.toggle_enabled = False
+        # Settings shortcut (Cmd+,) rides on the same global key monitor
+        self.hotkey_manager.register_secondary(
+            "<cmd>+,", lambda: AppHelper.callAfter(self._open_settings_window)
+        )
+        self.hotkey_manager.start_listening()
+
+        # Enable the dictation hotkey only when both ASR and audio subsystems are ready
         # Use a polling timer that checks readiness every 0.5 seconds
         print("MAIN_APP: Scheduling hotkey manager startup (waiting for subsystems)...")
         self._startup_check_timer = rumps.Timer(self._check_readiness_and_start_hotkeys, 0.5)
         self._startup_check_timer.start()
 
-        # Set up global settings shortcut (Cmd+,)
         global _app_instance
         _app_instance = self
-        self._settings_shortcut_active = False
-        self._setup_settings_shortcut()
 
         # Set up application menu (YardTalk menu) with Settings item
         # Also set as app delegate for Dock menu support
         self._menu_handler = AppMenuHandler.alloc().init()
         NSApplication.sharedApplication().setDelegate_(self._menu_handler)
-        rumps.Timer(self._setup_app_menu, 0.5).start()
+        AppHelper.callLater(0.5, self._setup_app_menu, None)
 
         # Initial menu state is set above, will be updated by ASR callback
 
@@ -713,7 +853,9 @@ class DictationApp(rumps.App):
         """Internal method to start the hotkey manager."""
         print("MAIN_APP: Starting hotkey manager...")
         try:
+            # No-op if the listener is already running from __init__
             self.hotkey_manager.start_listening()
+            self.hotkey_manager.toggle_enabled = True
             display_hotkey = hotkey_to_display(self.hotkey_string)
             print(f"MAIN_APP: Hotkey manager started successfully for {self.hotkey_string}")
             rumps.notification("YardTalk Ready", "Dictation available", f"Press {display_hotkey} to start dictation")
@@ -721,146 +863,56 @@ class DictationApp(rumps.App):
             print(f"MAIN_APP: Failed to start hotkey manager: {e}")
             rumps.alert("Hotkey Error", f"Failed to start hotkey listener: {e}")
 
-    def _start_hotkey_manager(self, timer):
+    def _start_hotkey_manager(self, timer=None):
         """Start the hotkey manager after rumps is fully initialized (legacy, kept for compatibility)"""
         self._start_hotkey_manager_internal()
-        timer.stop()  # Make this a one-shot timer
+        if timer is not None:
+            timer.stop()  # Make this a one-shot timer
 
-    def _setup_app_menu(self, timer):
+    def _setup_app_menu(self, timer=None):
         """Add Settings to the application menu after rumps is initialized"""
         try:
             if setup_app_menu(self._menu_handler):
                 print("MAIN_APP: Application menu configured with Settings")
-                # Verify recent_submenu was set
-                has_submenu = hasattr(self._menu_handler, 'recent_submenu')
-                submenu_value = getattr(self._menu_handler, 'recent_submenu', None)
-                print(f"HISTORY DEBUG: After setup_app_menu - has recent_submenu: {has_submenu}, value: {submenu_value}")
+                # Resolved once here; update_menu_state and the history menu read these
+                self._native_toggle_item = getattr(self._menu_handler, 'toggle_menu_item', None)
+                self._native_recent_menu = getattr(self._menu_handler, 'recent_submenu', None)
+                logging.debug("HISTORY DEBUG: After setup_app_menu - recent_submenu: %s",
+                              self._native_recent_menu)
             else:
                 print("MAIN_APP: Could not configure application menu")
         except Exception as e:
-            print(f"MAIN_APP: Error setting up app menu: {e}")
-            import traceback
-            traceback.print_exc()
+            logging.exception("MAIN_APP: Error setting up app menu: %s", e)
         finally:
-            timer.stop()  # Make this a one-shot timer
-
-    def _setup_settings_shortcut(self):
-        """Set up Cmd+, global shortcut to open Settings."""
-        import sys as _sys
-
-        # Check if running as bundled app
-        is_bundled = getattr(_sys, "frozen", False) and _sys.platform == "darwin"
-
-        if is_bundled:
-            # Use native NSEvent monitoring for bundled apps
-            self._setup_settings_shortcut_native()
-        else:
-            # Use pynput for development mode
-            self._setup_settings_shortcut_pynput()
-
-    def _setup_settings_shortcut_native(self):
-        """Set up Cmd+, shortcut using native macOS NSEvent monitoring."""
-        try:
-            from Quartz import (
-                NSEvent,
-                NSEventMaskKeyDown,
-                NSEventTypeKeyDown,
-            )
-
-            # macOS key code for comma is 43
-            COMMA_KEY_CODE = 43
-            # Modifier flag for Command key
-            NSEventModifierFlagCommand = 1 << 20
-
-            def handle_settings_event(event):
-                try:
-                    if event.type() == NSEventTypeKeyDown:
-                        key_code = event.keyCode()
-                        flags = event.modifierFlags()
-
-                        # Check for Cmd+, (comma with command modifier)
-                        cmd_down = bool(flags & NSEventModifierFlagCommand)
-                        if key_code == COMMA_KEY_CODE and cmd_down:
-                            print("MAIN_APP: Settings shortcut (Cmd+,) detected via native event!")
-                            AppHelper.callAfter(self._open_settings_window)
-                except Exception as e:
-                    print(f"MAIN_APP: Error in settings event handler: {e}")
-
-            self._settings_native_monitor = NSEvent.addGlobalMonitorForEventsMatchingMask_handler_(
-                NSEventMaskKeyDown,
-                handle_settings_event
-            )
-
-            if self._settings_native_monitor:
-                print("MAIN_APP: Settings shortcut (Cmd+,) native monitor started")
-            else:
-                print("MAIN_APP: WARNING - Settings native monitor returned None")
-        except ImportError as e:
-            print(f"MAIN_APP: Quartz import failed for settings shortcut: {e}")
-            # Fall back to pynput
-            self._setup_settings_shortcut_pynput()
-        except Exception as e:
-            print(f"MAIN_APP: Failed to setup native settings shortcut: {e}")
-            self._setup_settings_shortcut_pynput()
-
-    def _setup_settings_shortcut_pynput(self):
-        """Set up Cmd+, shortcut using pynput (for development mode)."""
-        from pynput import keyboard
-
-        def on_key_press(key):
-            # Track Cmd key state
-            if key == keyboard.Key.cmd or key == keyboard.Key.cmd_l or key == keyboard.Key.cmd_r:
-                self._cmd_pressed = True
-                return
-
-            # Check for comma key while Cmd is held
-            if self._cmd_pressed:
-                # Check by character
-                is_comma = False
-                if hasattr(key, 'char') and key.char == ',':
-                    is_comma = True
-                # Also check by virtual key code (43 is comma on macOS)
-                elif hasattr(key, 'vk') and key.vk == 43:
-                    is_comma = True
-
-                if is_comma:
-                    print("MAIN_APP: Settings shortcut (Cmd+,) detected!")
-                    AppHelper.callAfter(self._open_settings_window)
-
-        def on_key_release(key):
-            if key == keyboard.Key.cmd or key == keyboard.Key.cmd_l or key == keyboard.Key.cmd_r:
-                self._cmd_pressed = False
-
-        self._cmd_pressed = False
-        self._settings_listener = keyboard.Listener(
-            on_press=on_key_press,
-            on_release=on_key_release
-        )
-        self._settings_listener.start()
-        print("MAIN_APP: Settings shortcut (Cmd+,) pynput listener started")
-
-    def _stop_settings_shortcut(self):
-        """Stop the settings shortcut listener/monitor."""
-        # Stop native monitor if active
-        if hasattr(self, '_settings_native_monitor') and self._settings_native_monitor:
-            print("MAIN_APP: Stopping settings native monitor")
+            if timer is not None:
+                timer.stop()  # Make this a one-shot timer
+
+    def _overlay_feed_loop(self):
+        """Hand audio chunks queued by _process_audio_chunk to the overlay."""
+        get_chunk = self._overlay_chunks.get
+        get_pending = self._overlay_chunks.get_nowait
+        while True:
+            chunk = get_chunk()
+            # If the overlay fell behind, hand it the whole backlog as one block
+            pending = []
             try:
-                from Quartz import NSEvent
-                NSEvent.removeMonitor_(self._settings_native_monitor)
-            except Exception as e:
-                print(f"MAIN_APP: Error stopping settings native monitor: {e}")
-            self._settings_native_monitor = None
-
-        # Stop pynput listener if active
-        if hasattr(self, '_settings_listener') and self._settings_listener:
-            print("MAIN_APP: Stopping settings pynput listener")
+                while True:
+                    pending.append(get_pending())
+            except queue.Empty:
+                pass
+            if pending:
+                pending.insert(0, chunk)
+                chunk = np.concatenate(pending)
+            overlay = self.overlay_window
+            if overlay is None:
+                continue
             try:
-                self._settings_listener.stop()
+                overlay.add_chunk(chunk)
             except Exception as e:
-                print(f"MAIN_APP: Error stopping settings pynput listener: {e}")
-            self._settings_listener = None
+                print(f"MAIN_APP: Error feeding overlay: {e}")
 
     def _process_audio_chunk(self, chunk):
+        self._samples_seen += chunk.shape[0]
         self.asr_service.process_audio_chunk(chunk)
 
         # Diagnostic logging for overlay state
@@ -874,8 +926,11 @@ class DictationApp(rumps.App):
                 overlay_visible = getattr(self.overlay_window, '_is_visible', 'N/A')
                 waveform_view = getattr(self.overlay_window, '_waveform_view', None)
                 waveform_active = getattr(waveform_view, '_is_active', 'N/A') if waveform_view else 'N/A'
-                print(f"MAIN_APP: Chunk #{self._chunk_log_count} - overlay_visible={overlay_visible}, waveform_active={waveform_active}")
-            self.overlay_window.add_chunk(chunk)
+                logging.debug(
+                    "MAIN_APP: Chunk #%d - overlay_visible=%s, waveform_active=%s",
+                    self._chunk_log_count, overlay_visible, waveform_active,
+                )
+            self._overlay_chunks.put(chunk)
         else:
             print("MAIN_APP: WARNING - overlay_window is None, can't add chunk")
 
@@ -885,27 +940,35 @@ class DictationApp(rumps.App):
 
         # Silence detection for auto-send (only if enabled)
         if self.dictation_active and not self._auto_stop_pending and self.silence_auto_stop_enabled:
-            # Calculate RMS (root mean square) of the audio chunk
-            audio_data = chunk.flatten().astype(np.float32)
-            rms = np.sqrt(np.mean(audio_data ** 2))
-
-            current_time = time.time()
+            # rms > threshold is tested as ssq > threshold^2 * n, so no sqrt
+            # or division per chunk
+            flat = chunk.reshape(-1)
+            ssq = chunk_sum_of_squares(flat)
+            is_sound = ssq > self._silence_threshold_sq * flat.size
 
             # Log RMS periodically for debugging
             if not hasattr(self, '_rms_log_count'):
                 self._rms_log_count = 0
             self._rms_log_count += 1
-            if self._rms_log_count % 20 == 1:  # Log every 20 chunks
-                silence_elapsed = current_time - self._last_sound_time if self._last_sound_time else 0
-                print(f"MAIN_APP: Audio RMS={rms:.0f} (threshold={self.silence_threshold}), silence_elapsed={silence_elapsed:.1f}s")
+            if self._rms_log_count % 20 == 1 and logging.getLogger().isEnabledFor(logging.DEBUG):  # Log every 20 chunks
+                rms = math.sqrt(ssq / flat.size) if flat.size else 0.0
+                silence_elapsed = (
+                    (self._samples_seen - self._last_sound_sample) / self.sample_rate
+                    if self._last_sound_sample is not None else 0
+                )
+                logging.debug(
+                    "MAIN_APP: Audio RMS=%.0f (threshold=%s), silence_elapsed=%.1fs",
+                    rms, self.silence_threshold, silence_elapsed,
+                )
 
-            if rms > self.silence_threshold:
+            if is_sound:
                 # Sound detected - reset the silence timer
-                self._last_sound_time = current_time
-            elif self._last_sound_time is not None:
+                self._last_sound_sample = self._samples_seen
+            elif self._last_sound_sample is not None:
                 # Check if we've been silent long enough
-                silence_elapsed = current_time - self._last_sound_time
+                silence_elapsed = (self._samples_seen - self._last_sound_sample) / self.sample_rate
                 if silence_elapsed >= self.silence_duration:
+                    rms = math.sqrt(ssq / flat.size) if flat.size else 0.0
                     print(f"MAIN_APP: Auto-stop triggered after {silence_elapsed:.1f}s of silence (RMS: {rms:.0f})")
                     self._auto_stop_pending = True
                     AppHelper.callAfter(self._auto_deactivate_dictation)
@@ -918,26 +981,38 @@ class DictationApp(rumps.App):
             self.request_deactivate_dictation()
         self._auto_stop_pending = False
 
-    def _create_timer_on_main(self, payload_with_context):
-        # payload_with_context is expected to be timer_payload_for_main_thread from _handle_asr_service_result
-        # Let's assume it might contain a 'log_id' if we pass it from _handle_asr_service_result
-        log_id_for_timer = payload_with_context.pop('log_id_for_timer', f"timer_{time.monotonic()}")
+    def _on_main(self, fn, *args):
+        """Call fn now if on the main thread, otherwise schedule it there."""
+        if NSThread.isMainThread():
+            fn(*args)
+        else:
+            AppHelper.callAfter(fn, *args)
+
+    def _post_notification(self, title, subtitle, message):
+        """
+        Post a notification on a later run loop turn.
+
+        Notification Center calls must stay on the main thread, so rather than
+        a worker this just lets the dictation state change that triggered it
+        (overlay, menu title, mic) finish before the post.
+        """
+        AppHelper.callAfter(rumps.notification, title, subtitle, message)
 
-        # This method is called on the main thread via performSelectorOnMainThread_
+    def _create_timer_on_main(self, event: AsrEvent):
+        # This method is called on the main thread via AppHelper.callAfter
+        log_id_for_timer = event.log_id
         print(f"MAIN_APP ({log_id_for_timer}): _create_timer_on_main executing on main thread.")
         timer_instance = rumps.Timer(self._process_asr_result_on_main_thread, 0.0)
-        timer_instance.user_payload = payload_with_context # This is the original timer_payload_for_main_thread
+        timer_instance.user_payload = event
         timer_instance.log_id = log_id_for_timer # Attach log_id to timer instance
         
-        if not hasattr(self, 'active_timers'):
-            self.active_timers = []
-        self.active_timers.append(timer_instance)
+        self.active_timers.add(timer_instance)
         timer_instance.start()
         print(f"MAIN_APP ({log_id_for_timer}): Timer started for _process_asr_result_on_main_thread.")
 
     def _handle_asr_service_result(self, result_payload, error_payload):
         # Generate a log ID for this specific ASR result handling sequence
-        asr_result_log_id = f"asr_res_{time.monotonic()}"
+        asr_result_log_id = f"asr_res_{self._next_log_id()}"
 
         # Extract text for logging (handle both strings and TranscriptionResult)
         if isinstance(result_payload, TranscriptionResult):
@@ -954,16 +1029,16 @@ class DictationApp(rumps.App):
             return
 
         callback_type = ASR_CALLBACK_TYPE_TRANSCRIPTION
-        data_to_pass = {'result': result_payload, 'error': error_payload}
+        event = AsrEvent(callback_type, result_payload, error_payload, asr_result_log_id)
 
         if result_payload == "MODEL_LOADED_SUCCESSFULLY":
             callback_type = ASR_CALLBACK_TYPE_MODEL_LOAD
-            data_to_pass = {'status': "loaded", 'error': None}
+            event = AsrEvent(callback_type, "loaded", None, asr_result_log_id)
             self._model_loaded_handled = True
             print(f"MAIN_APP ({asr_result_log_id}): Processed as MODEL_LOADED_SUCCESSFULLY.")
         elif error_payload and self.asr_model_status == "initializing":
             callback_type = ASR_CALLBACK_TYPE_MODEL_LOAD
-            data_to_pass = {'status': "error", 'error': error_payload}
+            event = AsrEvent(callback_type, "error", error_payload, asr_result_log_id)
             print(f"MAIN_APP ({asr_result_log_id}): Processed as MODEL_LOAD error during init.")
         elif callback_type == ASR_CALLBACK_TYPE_TRANSCRIPTION:
             # Check for blank results - handle both TranscriptionResult and string
@@ -978,197 +1053,179 @@ class DictationApp(rumps.App):
 
             if is_blank:
                 print(f"MAIN_APP ({asr_result_log_id}): Empty or blank transcription received from ASRService. Skipping timer creation.")
-                # Explicitly set is_transcribing to False here if appropriate,
-                # as _process_asr_result_on_main_thread won't be called to do it.
-                if self.is_transcribing: # Only if we were actually waiting for a transcription
-                    self.is_transcribing = False
-                    print(f"MAIN_APP ({asr_result_log_id}): Set is_transcribing to False due to blank result.")
-                    # Potentially reset hotkey_manager.hotkey_active as well, like in _process_asr_result_on_main_thread finally block
-                    if self.hotkey_manager.hotkey_active:
-                        print(f"MAIN_APP ({asr_result_log_id}): Resetting hotkey_manager.hotkey_active from True to False (blank result).")
-                        self.hotkey_manager.hotkey_active = False
-                    self.update_menu_state()
+                # Nothing to show, so skip the timer and just reset state on the main thread
+                AppHelper.callAfter(self._finalize_empty_transcription, asr_result_log_id)
                 return
 
-        timer_payload_for_main_thread = {'type': callback_type, 'data': data_to_pass}
-
-        # Pass the asr_result_log_id to be used by _create_timer_on_main
-        payload_with_context = timer_payload_for_main_thread.copy() # Avoid modifying original dict if it's used elsewhere
-        payload_with_context['log_id_for_timer'] = asr_result_log_id
-
         print(f"MAIN_APP ({asr_result_log_id}): Posting to _create_timer_on_main via AppHelper.callAfter.")
-        AppHelper.callAfter(self._create_timer_on_main, payload_with_context)
+        AppHelper.callAfter(self._create_timer_on_main, event)
         print(f"MAIN_APP ({asr_result_log_id}): _handle_asr_service_result EXITED.")
 
+    def _finalize_empty_transcription(self, log_id):
+        """Reset transcription state after a blank result (main thread)."""
+        # _process_asr_result_on_main_thread won't run for this result
+        if not self.is_transcribing: # Only if we were actually waiting for a transcription
+            return
+        self.is_transcribing = False
+        print(f"MAIN_APP ({log_id}): Set is_transcribing to False due to blank result.")
+        # Reset hotkey_manager.hotkey_active as well, like in _process_asr_result_on_main_thread finally block
+        if self.hotkey_manager.hotkey_active:
+            print(f"MAIN_APP ({log_id}): Resetting hotkey_manager.hotkey_active from True to False (blank result).")
+            self.hotkey_manager.hotkey_active = False
+        # The overlay is still showing the processing indicator
+        if self.overlay_window:
+            self.overlay_window.hide()
+        self.update_menu_state()
+
     def _process_asr_result_on_main_thread(self, timer_instance): # Receives the Timer instance
-        log_id = hasattr(timer_instance, 'log_id') and timer_instance.log_id or "unknown_timer"
+        log_id = getattr(timer_instance, 'log_id', None) or "unknown_timer"
         print(f"MAIN_APP ({log_id}): _process_asr_result_on_main_thread ENTERED.")
-        try:
-            # This runs on the main Rumps thread
-            user_payload = timer_instance.user_payload
-            callback_type = user_payload['type']
-            data = user_payload['data']
-
-            if callback_type == ASR_CALLBACK_TYPE_MODEL_LOAD:
-                status = data['status']
-                error = data['error']
-                if status == "loaded":
-                    self.asr_model_status = "loaded"
-                    rumps.notification("Dictation App", "Ready", f"ASR model loaded. Press {self.hotkey_string} to dictate.")
-                elif status == "error":
-                    self.asr_model_status = "error"
-                    rumps.alert("ASR Model Error", f"Failed to load ASR model: {str(error)}. Transcription will not be available.")
-            
-            elif callback_type == ASR_CALLBACK_TYPE_TRANSCRIPTION:
-                transcription_result = data['result']
-                error_obj = data['error'] # Renamed to avoid conflict with 'error' in MODEL_LOAD
+        # Fix 1 (part 2): Make this timer truly one-shot
+        timer_instance.stop()
+        self.active_timers.discard(timer_instance)
+
+        # The kind is fixed when the event is built, so dispatch once here
+        # rather than re-checking it in a shared finally
+        event = timer_instance.user_payload
+        if event.kind == ASR_CALLBACK_TYPE_MODEL_LOAD:
+            self._on_model_load_event(event, log_id)
+        else:
+            self._on_transcription_event(event, log_id)
 
-                # Existing handling for actual transcription results
-                try:
-                    if error_obj:
-                        rumps.alert("Transcription Failed", f"Could not transcribe audio: {str(error_obj)}")
-                        return
-
-                    # Handle both TranscriptionResult and plain strings (backwards compat)
-                    if isinstance(transcription_result, TranscriptionResult):
-                        transcribed_text = transcription_result.text
-                    elif isinstance(transcription_result, str):
-                        transcribed_text = transcription_result
-                        # Wrap string in TranscriptionResult for consistency
-                        transcription_result = TranscriptionResult.from_text_only(transcribed_text)
-                    else:
-                        transcribed_text = str(transcription_result) if transcription_result else ""
-                        transcription_result = TranscriptionResult.from_text_only(transcribed_text)
-
-                    # Fix 1 (part 1): Bail out early on empty text
-                    # This check is now also in _handle_asr_service_result, but good to have defensively here too.
-                    if not transcribed_text or not transcribed_text.strip():
-                        print(f"MAIN_APP ({log_id}): Transcription result is None or blank. Bailing out early from processing.")
-                        # No notification for blank text here, as it's handled by _handle_asr_service_result or if it slips through.
-                        return # Return directly from here. The finally block will still execute.
-
-                    # We have non-blank transcription
-                    if transcribed_text == self._last_transcribed_text:
-                        pass
-                    else:
-                        print("--- Transcribed Text ---")
-                        print(transcribed_text)
-                        if transcription_result.has_timestamps:
-                            print(f"Duration: {transcription_result.formatted_duration()}")
-                            print(f"Segments: {len(transcription_result.segment_timestamps)}, Words: {len(transcription_result.word_timestamps)}")
-                        print("------------------------")
-                        # Check if we should skip the edit window
-                        if self.skip_edit_window:
-                            # Direct insertion without edit window
-                            print(f"MAIN_APP ({log_id}): Skip edit window enabled, inserting directly...")
-                            self._handle_direct_insertion(transcription_result, transcribed_text, log_id)
-                        else:
-                            # Show correction window for review
-                            print(f"MAIN_APP ({log_id}): Showing correction window for review...")
-                            self._waiting_for_correction = True
-                            self._pending_transcription_result = transcription_result  # Store full result
-                            self._pending_transcription_text = transcribed_text  # Store text for cancel handler
-                            AppHelper.callAfter(self.correction_window.show, transcription_result)
-                finally:
-                    # This 'finally' is for the inner try related to processing transcription text and errors.
-                    # The main state flags (is_transcribing, dictation_active) are reset in the outer finally block.
-                    pass # Placeholder, could remove this inner finally if not strictly needed
-        except Exception as e_outer:
-            print(f"MAIN_APP ({log_id}): CRITICAL ERROR in _process_asr_result_on_main_thread: {e_outer}")
-            import traceback
-            traceback.print_exc()
+    def _on_model_load_event(self, event: AsrEvent, log_id):
+        """Apply a model load result from the ASR service."""
+        try:
+            if event.result == "loaded":
+                self.asr_model_status = "loaded"
+                rumps.notification("Dictation App", "Ready", f"ASR model loaded. Press {self.hotkey_string} to dictate.")
+            elif event.result == "error":
+                self.asr_model_status = "error"
+                rumps.alert("ASR Model Error", f"Failed to load ASR model: {str(event.error)}. Transcription will not be available.")
+        except Exception as e:
+            logging.exception("MAIN_APP (%s): CRITICAL ERROR in _on_model_load_event: %s", log_id, e)
         finally:
-            # Fix 1 (part 2): Make this timer truly one-shot
-            print(f"MAIN_APP ({log_id}): Stopping and removing timer.")
-            timer_instance.stop()
-            if timer_instance in self.active_timers:
-                self.active_timers.remove(timer_instance)
+            self.update_menu_state()
+
+    def _on_transcription_event(self, event: AsrEvent, log_id):
+        """Hand a finished transcription to review or insertion, then reset dictation state."""
+        try:
+            transcription_result = event.result
+            if event.error:
+                rumps.alert("Transcription Failed", f"Could not transcribe audio: {str(event.error)}")
+                return
+
+            # Handle both TranscriptionResult and plain strings (backwards compat)
+            if isinstance(transcription_result, TranscriptionResult):
+                transcribed_text = transcription_result.text
+            elif isinstance(transcription_result, str):
+                transcribed_text = transcription_result
+                # Wrap string in TranscriptionResult for consistency
+                transcription_result = TranscriptionResult.from_text_only(transcribed_text)
             else:
-                print(f"MAIN_APP ({log_id}): Timer was not in active_timers list for removal.")
-
-            # This is the outer finally, ensure state flags are reset here if a transcription was processed (or attempted)
-            # Only reset these if it was a transcription callback, not a model_load callback.
-            # Also skip if correction window is open (state will be reset by correction callbacks)
-            if callback_type == ASR_CALLBACK_TYPE_TRANSCRIPTION:
-                if self._waiting_for_correction:
-                    print(f"MAIN_APP ({log_id}): Outer FINALLY - Correction window open, skipping state reset.")
-                else:
-                    print(f"MAIN_APP ({log_id}): Outer FINALLY for ASR_CALLBACK_TYPE_TRANSCRIPTION. is_transcribing PRE: {self.is_transcribing}, dictation_active PRE: {self.dictation_active}")
-                    self.is_transcribing = False
-                    self.dictation_active = False
-
-                    current_hotkey_active_state = self.hotkey_manager.hotkey_active
-                    print(f"MAIN_APP ({log_id}): Hotkey_manager.hotkey_active PRE-check: {current_hotkey_active_state}")
-                    if self.hotkey_manager.hotkey_active:
-                        print(f"MAIN_APP ({log_id}): Resetting hotkey_manager.hotkey_active from True to False.")
-                        self.hotkey_manager.hotkey_active = False
-
-                    audio_is_recording_flag = getattr(self.audio_manager, "_is_recording", "N/A")
-                    print(f"MAIN_APP ({log_id}): AudioManager._is_recording PRE-check: {audio_is_recording_flag}")
-                    if audio_is_recording_flag == True:
-                        print(f"MAIN_APP ({log_id}): Cleanup – mic was still flagged recording; stopping.")
-                        self.audio_manager.stop_recording(f"from_process_asr_result_finally_{log_id}")
-                        if self.overlay_window:
-                            AppHelper.callAfter(self.overlay_window.hide)
-
-                    print(f"MAIN_APP ({log_id}): is_transcribing POST: {self.is_transcribing}, dictation_active POST: {self.dictation_active}")
+                transcribed_text = str(transcription_result) if transcription_result else ""
+                transcription_result = TranscriptionResult.from_text_only(transcribed_text)
+
+            # Fix 1 (part 1): Bail out early on empty text
+            # This check is now also in _handle_asr_service_result, but good to have defensively here too.
+            if not transcribed_text or not transcribed_text.strip():
+                print(f"MAIN_APP ({log_id}): Transcription result is None or blank. Bailing out early from processing.")
+                return # The finally block will still execute.
+
+            # We have non-blank transcription
+            if transcribed_text == self._last_transcribed_text:
+                return
+
+            print("--- Transcribed Text ---")
+            print(transcribed_text)
+            if transcription_result.has_timestamps:
+                print(f"Duration: {transcription_result.formatted_duration()}")
+                print(f"Segments: {len(transcription_result.segment_timestamps)}, Words: {len(transcription_result.word_timestamps)}")
+            print("------------------------")
+            # Check if we should skip the edit window
+            if self.skip_edit_window:
+                # Direct insertion without edit window
+                print(f"MAIN_APP ({log_id}): Skip edit window enabled, inserting directly...")
+                self._handle_direct_insertion(transcription_result, transcribed_text, log_id)
+            else:
+                # Show correction window for review
+                print(f"MAIN_APP ({log_id}): Showing correction window for review...")
+                self._waiting_for_correction = True
+                self._pending_transcription_result = transcription_result  # Store full result
+                self._pending_transcription_text = transcribed_text  # Store text for cancel handler
+                self._on_main(self.correction_window.show, transcription_result)
+        except Exception as e:
+            logging.exception("MAIN_APP (%s): CRITICAL ERROR in _on_transcription_event: %s", log_id, e)
+        finally:
+            # Skip if correction window is open (state will be reset by correction callbacks)
+            if self._waiting_for_correction:
+                print(f"MAIN_APP ({log_id}): FINALLY - Correction window open, skipping state reset.")
             else:
-                print(f"MAIN_APP ({log_id}): Outer FINALLY for {callback_type}. Not resetting transcription-specific flags.")
+                print(f"MAIN_APP ({log_id}): FINALLY - is_transcribing PRE: {self.is_transcribing}, dictation_active PRE: {self.dictation_active}")
+                self.is_transcribing = False
+                self.dictation_active = False
+
+                if self.hotkey_manager.hotkey_active:
+                    print(f"MAIN_APP ({log_id}): Resetting hotkey_manager.hotkey_active from True to False.")
+                    self.hotkey_manager.hotkey_active = False
+
+                # Deactivation stops the mic before submitting, so this only
+                # fires (and logs) when that path was skipped
+                if self.audio_manager.is_recording:
+                    print(f"MAIN_APP ({log_id}): Cleanup – mic was still flagged recording; stopping.")
+                    self.audio_manager.stop_recording(f"from_process_asr_result_finally_{log_id}")
+                    if self.overlay_window:
+                        self._on_main(self.overlay_window.hide)
+
+                print(f"MAIN_APP ({log_id}): is_transcribing POST: {self.is_transcribing}, dictation_active POST: {self.dictation_active}")
 
             self.update_menu_state()
 
     def request_activate_dictation(self):
         AppHelper.callAfter(self._activate_dictation_main)
 
+    def _refuse_activation(self, log_id, reason):
+        """Undo the hotkey toggle for an activation that isn't going ahead."""
+        if self.hotkey_manager.hotkey_active:
+            self.hotkey_manager.hotkey_active = False
+        print(f"MAIN_APP ({log_id}): {reason}, returning.")
+
     def _activate_dictation_main(self):
-        self._debug_id_counter += 1
-        log_id = f"activate_{self._debug_id_counter}"
+        log_id = f"activate_{self._next_log_id()}"
         print(f"MAIN_APP ({log_id}): _activate_dictation_main ENTERED.")
         
         # Directive B: Stop-before-restart guard
-        audio_is_recording_flag = getattr(self.audio_manager, "_is_recording", "N/A")
-        print(f"MAIN_APP ({log_id}): Directive B check: audio_manager._is_recording = {audio_is_recording_flag}")
-        if audio_is_recording_flag == True: # Explicitly check True
-            rumps.notification("Mic busy", "Still closing the previous stream…", "")
-            if self.hotkey_manager.hotkey_active: 
-                self.hotkey_manager.hotkey_active = False
-            print(f"MAIN_APP ({log_id}): Mic busy, returning.")
+        audio_is_recording_flag = self.audio_manager.is_recording
+        print(f"MAIN_APP ({log_id}): Directive B check: audio_manager.is_recording = {audio_is_recording_flag}")
+        if audio_is_recording_flag:
+            self._post_notification("Mic busy", "Still closing the previous stream…", "")
+            self._refuse_activation(log_id, "Mic busy")
             return
 
         print(f"MAIN_APP ({log_id}): State pre-activation: asr_model_status='{self.asr_model_status}', audio_status='{self.audio_subsystem_status}', is_transcribing={self.is_transcribing}, dictation_active={self.dictation_active}")
 
         # Check audio subsystem status first
         if self.audio_subsystem_status == "initializing":
-            rumps.notification("Initializing", "Audio system warming up...", "Please try again in a moment.")
-            if self.hotkey_manager.hotkey_active:
-                self.hotkey_manager.hotkey_active = False
-            print(f"MAIN_APP ({log_id}): Audio initializing, returning.")
+            self._post_notification("Initializing", "Audio system warming up...", "Please try again in a moment.")
+            self._refuse_activation(log_id, "Audio initializing")
             return
         if self.audio_subsystem_status == "error":
             error_msg = str(self.audio_manager.prewarm_error) if self.audio_manager.prewarm_error else "Unknown error"
             rumps.alert("Audio Error", f"Audio system failed to initialize:\n{error_msg}\n\nCheck System Settings > Privacy & Security > Microphone.")
-            if self.hotkey_manager.hotkey_active:
-                self.hotkey_manager.hotkey_active = False
-            print(f"MAIN_APP ({log_id}): Audio error, returning.")
+            self._refuse_activation(log_id, "Audio error")
             return
 
         # Check ASR model status
         if self.asr_model_status == "downloading":
-            rumps.notification("Downloading Model", "The speech model is still downloading.", "Please wait for the download to finish.")
-            if self.hotkey_manager.hotkey_active:
-                self.hotkey_manager.hotkey_active = False
-            print(f"MAIN_APP ({log_id}): Model downloading, returning.")
+            self._post_notification("Downloading Model", "The speech model is still downloading.", "Please wait for the download to finish.")
+            self._refuse_activation(log_id, "Model downloading")
             return
         if self.asr_model_status == "initializing":
-            rumps.notification("Initializing", "ASR model is loading...", "Please try again in a moment.")
-            if self.hotkey_manager.hotkey_active:
-                self.hotkey_manager.hotkey_active = False
-            print(f"MAIN_APP ({log_id}): ASR initializing, returning.")
+            self._post_notification("Initializing", "ASR model is loading...", "Please try again in a moment.")
+            self._refuse_activation(log_id, "ASR initializing")
             return
         if self.asr_model_status == "error":
             rumps.alert("ASR Error", "ASR model failed to load. Cannot start dictation.")
-            if self.hotkey_manager.hotkey_active:
-                self.hotkey_manager.hotkey_active = False
+            self._refuse_activation(log_id, "ASR error")
             return
         if self.is_transcribing:
             print(f"MAIN_APP ({log_id}): Already transcribing, returning.")
@@ -1178,9 +1235,7 @@ class DictationApp(rumps.App):
             print(f"MAIN_APP ({log_id}): Activation - Starting dictation logic...")
 
             # Capture the frontmost app NOW, before we show any UI
-            from AppKit import NSWorkspace
-            workspace = NSWorkspace.sharedWorkspace()
-            self._dictation_source_app = workspace.frontmostApplication()
+            self._dictation_source_app = self._workspace.frontmostApplication()
             if self._dictation_source_app:
                 print(f"MAIN_APP ({log_id}): Captured source app: {self._dictation_source_app.localizedName()} ({self._dictation_source_app.bundleIdentifier()})")
 
@@ -1189,7 +1244,7 @@ class DictationApp(rumps.App):
             print(f"MAIN_APP ({log_id}): Activation - After clearing ASR buffer.")
 
             self.dictation_active = True
-            self._last_sound_time = time.time()  # Initialize silence timer
+            self._last_sound_sample = self._samples_seen  # Initialize silence timer
             self._auto_stop_pending = False
             print(f"MAIN_APP ({log_id}): dictation_active SET to True.")
             if self.overlay_window:
@@ -1209,7 +1264,7 @@ class DictationApp(rumps.App):
             self.audio_manager.set_chunk_callback(self._process_audio_chunk)
             print(f"MAIN_APP ({log_id}): Calling audio_manager.start_recording().")
             if self.audio_manager.start_recording(f"from_activate_{log_id}"):
-                rumps.notification("Dictation Started", "Listening...", "Press hotkey again to stop.")
+                self._post_notification("Dictation Started", "Listening...", "Press hotkey again to stop.")
             else:
                 print(f"MAIN_APP ({log_id}): Activation - Failed to start audio recording.")
                 error_detail = None
@@ -1230,33 +1285,23 @@ class DictationApp(rumps.App):
             self.update_menu_state()
 
     def request_deactivate_dictation(self):
-        self._debug_id_counter += 1
-        log_id = f"deactivate_req_{self._debug_id_counter}"
+        log_id = f"deactivate_req_{self._next_log_id()}"
         print(f"MAIN_APP ({log_id}): request_deactivate_dictation called.")
         AppHelper.callAfter(self._deactivate_dictation_main)
 
     def _deactivate_dictation_main(self):
-        # Note: log_id for _deactivate_dictation_main will be from the request_... call context if needed,
-        # or we can generate one if it's called directly (though it shouldn't be).
-        # For now, let's assume AppHelper carries context or we manage within.
-        # For simplicity, use a new counter for direct calls to _deactivate_dictation_main if any.
-        # However, it's always called via AppHelper.callAfter(self._deactivate_dictation_main)
-        # which doesn't easily pass the log_id. Let's create one here.
-        # This might lead to the counter being less sequential across activate/deactivate if they interleave rapidly.
-        # A shared counter or passing log_id through AppHelper might be better if strict sequence is vital.
-        # For now, a local log_id for this function's scope:
-        # Let's use a timestamp for deactivate log_id to make it unique
-        import time
-        log_id = f"deactivate_main_{time.monotonic()}"
+        # Called via AppHelper.callAfter, which doesn't carry the request's log_id,
+        # so take a fresh one from the shared counter
+        log_id = f"deactivate_main_{self._next_log_id()}"
 
         print(f"MAIN_APP ({log_id}): _deactivate_dictation_main ENTERED.")
         print(f"MAIN_APP ({log_id}): State pre-deactivation: dictation_active={self.dictation_active}, is_transcribing={self.is_transcribing}")
 
         if not self.dictation_active:
             print(f"MAIN_APP ({log_id}): Deactivation called when dictation_active was False.")
-            audio_is_recording_flag = getattr(self.audio_manager, "_is_recording", "N/A")
-            print(f"MAIN_APP ({log_id}): audio_manager._is_recording = {audio_is_recording_flag}")
-            if audio_is_recording_flag == True: # Explicitly check True
+            audio_is_recording_flag = self.audio_manager.is_recording
+            print(f"MAIN_APP ({log_id}): audio_manager.is_recording = {audio_is_recording_flag}")
+            if audio_is_recording_flag:
                 print(f"MAIN_APP ({log_id}): AudioManager was unexpectedly recording. Stopping it now.")
                 self.audio_manager.stop_recording(f"from_deactivate_not_active_{log_id}")
             
@@ -1285,8 +1330,8 @@ class DictationApp(rumps.App):
         if self.overlay_window:
             # Disable live preview and switch to processing mode
             if self.overlay_window.live_preview_enabled:
-                AppHelper.callAfter(self.overlay_window.set_live_preview_enabled, False)
-            AppHelper.callAfter(self.overlay_window.show_processing)
+                self._on_main(self.overlay_window.set_live_preview_enabled, False)
+            self._on_main(self.overlay_window.show_processing)
         print(f"MAIN_APP ({log_id}): Audio recording stopped call returned.")
 
         if self.is_transcribing:
@@ -1297,12 +1342,13 @@ class DictationApp(rumps.App):
 
         print(f"MAIN_APP ({log_id}): Getting buffered audio from ASR service.")
         audio_to_transcribe = self.asr_service.get_buffered_audio_and_clear()
-        if audio_to_transcribe.size == 0:
+        sample_count = audio_to_transcribe.shape[0]  # Always a 1-D buffer
+        if not sample_count:
             print(f"MAIN_APP ({log_id}): Deactivation - Audio buffer is empty. Nothing to transcribe.")
             # Hide overlay since there's nothing to process
             if self.overlay_window:
-                AppHelper.callAfter(self.overlay_window.hide)
-            rumps.notification("Dictation Stopped", "No audio recorded.", "")
+                self._on_main(self.overlay_window.hide)
+            self._post_notification("Dictation Stopped", "No audio recorded.", "")
             # If nothing to transcribe, ensure hotkey_active is False if it was True from the deactivation press
             if self.hotkey_manager.hotkey_active:
                  print(f"MAIN_APP ({log_id}): No audio, ensuring hotkey_manager.hotkey_active is False.")
@@ -1311,11 +1357,11 @@ class DictationApp(rumps.App):
             print(f"MAIN_APP ({log_id}): _deactivate_dictation_main EXITED (no audio to transcribe path).")
             return
 
-        print(f"MAIN_APP ({log_id}): Submitting {len(audio_to_transcribe)} audio samples for transcription.")
+        logging.info("MAIN_APP (%s): Submitting %d audio samples for transcription.", log_id, sample_count)
         self.is_transcribing = True
         print(f"MAIN_APP ({log_id}): is_transcribing SET to True.")
         # Generate a log_id for this transcription request to track it into the callback
-        transcription_log_id = f"asr_req_{time.monotonic()}"
+        transcription_log_id = f"asr_req_{self._next_log_id()}"
         print(f"MAIN_APP ({log_id}): Submitting to ASR with transcription_log_id: {transcription_log_id}")
         # How to pass transcription_log_id to _handle_asr_service_result?
         # ASRService callback doesn't directly support passing extra context this way.
@@ -1328,17 +1374,22 @@ class DictationApp(rumps.App):
         # For now, just submit. The next step will be to modify the timer logic.
         self.asr_service.submit_transcription_request(audio_to_transcribe) 
         
-        rumps.notification("Dictation Stopped", "Processing audio...", "Please wait.")
+        self._post_notification("Dictation Stopped", "Processing audio...", "Please wait.")
         self.update_menu_state()
         print(f"MAIN_APP ({log_id}): _deactivate_dictation_main EXITED (submitted to ASR path).")
 
     def update_menu_state(self):
+        native_item = self._native_toggle_item
+        state = (self.asr_model_status, self.audio_subsystem_status, self.is_transcribing,
+                 self.dictation_active, self._start_title, native_item)
+        if state == self._menu_state:
+            return
+
         toggle_item = self.menu["Toggle Dictation"]
 
         # Keep app title stable to avoid rumps menu bar disappearing bug
         # Only change the menu item text to indicate state
-        display_hotkey = hotkey_to_display(self.hotkey_string)
-        menu_item_title = f"Start Dictation ({display_hotkey})"
+        menu_item_title = self._start_title
 
         # Determine menu state based on BOTH subsystems
         asr_initializing = self.asr_model_status == "initializing"
@@ -1361,42 +1412,58 @@ class DictationApp(rumps.App):
         elif self.dictation_active:
             menu_item_title = "Stop Dictation (Recording...)"
 
-        # Update rumps menu item
-        if toggle_item and toggle_item.title != menu_item_title:
+        # Inputs changed, so write the titles without reading them back first
+        if toggle_item:
             toggle_item.title = menu_item_title
 
         # Update native AppKit menu item (Dictation > Start/Stop Dictation)
-        if hasattr(self, '_menu_handler') and hasattr(self._menu_handler, 'toggle_menu_item'):
-            native_item = self._menu_handler.toggle_menu_item
-            if native_item and native_item.title() != menu_item_title:
-                native_item.setTitle_(menu_item_title)
+        if native_item is not None:
+            native_item.setTitle_(menu_item_title)
+
+        self._menu_state = state
 
     def _build_history_menu_items(self) -> list:
-        """Build the Recent Transcriptions submenu items."""
+        """
+        Build the Recent Transcriptions submenu items.
+
+        Items are cached per entry, so a rebuild only creates items for new
+        entries and retitles the rest (their relative times change).
+        """
         entries = self.transcription_history.get_entries()
 
         if not entries:
+            self._rumps_history_items = {}
             # Return a disabled placeholder item
             placeholder = rumps.MenuItem("No transcriptions yet")
             placeholder.set_callback(None)
             return [placeholder]
 
+        cached = self._rumps_history_items
+        current = {}
         items = []
         for entry in entries:
-            # Create menu item with closure to capture the entry
-            def make_callback(e):
-                return lambda sender: self._copy_history_entry(e)
-
-            item = rumps.MenuItem(entry.menu_title(), callback=make_callback(entry))
+            # Keyed by id(); the entry check guards against a reused id
+            hit = cached.get(id(entry))
+            if hit is not None and hit[0] is entry:
+                item = hit[1]
+                item.title = entry.menu_title()
+            else:
+                item = rumps.MenuItem(entry.menu_title(),
+                                      callback=functools.partial(self._copy_history_entry, entry))
+            current[id(entry)] = (entry, item)
             items.append(item)
+        # Evicted entries drop out of the cache here
+        self._rumps_history_items = current
 
         # Add separator and clear option
         items.append(None)  # Separator
-        items.append(rumps.MenuItem("Clear History", callback=self._clear_history))
+        if self._rumps_clear_history_item is None:
+            self._rumps_clear_history_item = rumps.MenuItem("Clear History", callback=self._clear_history)
+        items.append(self._rumps_clear_history_item)
 
         return items
 
-    def _copy_history_entry(self, entry):
+    def _copy_history_entry(self, entry, _sender=None):
         """Copy a history entry to clipboard."""
         pb = NSPasteboard.generalPasteboard()
         pb.clearContents()
@@ -1410,77 +1477,125 @@ class DictationApp(rumps.App):
     def _clear_history(self, _):
         """Clear all history entries."""
         self.transcription_history.clear()
+        self._pending_history_entries = []
         self._update_history_menu()
         rumps.notification("History Cleared", "", "")
 
     def _update_history_menu(self):
-        """Refresh the Recent Transcriptions submenu (both rumps and native menus)."""
-        print("HISTORY DEBUG: _update_history_menu() called")
+        """Rebuild the Recent Transcriptions submenu (both rumps and native menus)."""
+        logging.debug("HISTORY DEBUG: _update_history_menu() called")
+        self._rebuild_rumps_history_menu()
+
+        # Update native menu bar (Dictation > Recent Transcriptions)
+        native_menu = self._native_history_menu()
+        if native_menu is None:
+            logging.warning("HISTORY DEBUG: _menu_handler or recent_submenu not found")
+            return
+
+        # Clear existing items
+        native_menu.removeAllItems()
+
+        entries = self.transcription_history.get_entries()
+        logging.debug("HISTORY DEBUG: Found %d entries to display", len(entries))
+        if not entries:
+            placeholder = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+                "No transcriptions yet", "", ""
+            )
+            placeholder.setEnabled_(False)
+            native_menu.addItem_(placeholder)
+            logging.debug("HISTORY DEBUG: Added placeholder (no entries)")
+        else:
+            for entry in entries:
+                native_menu.addItem_(self._new_native_history_item(entry))
+            self._add_native_history_footer(native_menu)
+        self._native_history_count = len(entries)
 
-        # Update rumps menu
+        logging.debug("HISTORY DEBUG: Native menu now has %d entries", self._native_history_count)
+
+    def _rebuild_rumps_history_menu(self):
+        """Repopulate the rumps Recent Transcriptions submenu."""
         history_menu = self.menu.get("Recent Transcriptions")
-        if history_menu is not None:
-            history_menu.clear()
-            new_items = self._build_history_menu_items()
-            for item in new_items:
-                if item is None:
-                    history_menu.add(rumps.separator)
-                else:
-                    history_menu.add(item)
-            print(f"HISTORY DEBUG: Updated rumps menu with {len(new_items)} items")
+        if history_menu is None:
+            return
+        history_menu.clear()
+        new_items = self._build_history_menu_items()
+        for item in new_items:
+            if item is None:
+                history_menu.add(rumps.separator)
+            else:
+                history_menu.add(item)
+        logging.debug("HISTORY DEBUG: Updated rumps menu with %d items", len(new_items))
 
-        # Update native menu bar (Dictation > Recent Transcriptions)
-        print(f"HISTORY DEBUG: hasattr _menu_handler: {hasattr(self, '_menu_handler')}")
-        if hasattr(self, '_menu_handler'):
-            print(f"HISTORY DEBUG: hasattr recent_submenu: {hasattr(self._menu_handler, 'recent_submenu')}")
-
-        if hasattr(self, '_menu_handler') and hasattr(self._menu_handler, 'recent_submenu'):
-            native_menu = self._menu_handler.recent_submenu
-            print(f"HISTORY DEBUG: native_menu object: {native_menu}")
-            if native_menu:
-                # Clear existing items
-                native_menu.removeAllItems()
-
-                entries = list(self.transcription_history.get_entries())
-                print(f"HISTORY DEBUG: Found {len(entries)} entries to display")
-                if not entries:
-                    placeholder = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                        "No transcriptions yet", "", ""
-                    )
-                    placeholder.setEnabled_(False)
-                    native_menu.addItem_(placeholder)
-                    print("HISTORY DEBUG: Added placeholder (no entries)")
-                else:
-                    for entry in entries:
-                        print(f"HISTORY DEBUG: Adding menu item: '{entry.menu_title()}'")
-                        item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                            entry.menu_title(), "copyHistoryEntry:", ""
-                        )
-                        item.setTarget_(self._menu_handler)
-                        item.setRepresentedObject_(entry)
-                        native_menu.addItem_(item)
-
-                    # Add separator and clear option
-                    native_menu.addItem_(NSMenuItem.separatorItem())
-                    clear_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                        "Clear History", "clearHistory:", ""
-                    )
-                    clear_item.setTarget_(self._menu_handler)
-                    native_menu.addItem_(clear_item)
-
-                print(f"HISTORY DEBUG: Native menu now has {native_menu.numberOfItems()} items")
+    def _native_history_menu(self):
+        """Return the menu bar's Recent Transcriptions NSMenu, if it exists yet."""
+        return self._native_recent_menu
+
+    def _new_native_history_item(self, entry):
+        item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            entry.menu_title(), "copyHistoryEntry:", ""
+        )
+        item.setTarget_(self._menu_handler)
+        item.setRepresentedObject_(entry)
+        return item
+
+    def _add_native_history_footer(self, native_menu):
+        """Append the separator and Clear History item below the entries."""
+        native_menu.addItem_(NSMenuItem.separatorItem())
+        clear_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            "Clear History", "clearHistory:", ""
+        )
+        clear_item.setTarget_(self._menu_handler)
+        native_menu.addItem_(clear_item)
+
+    def _flush_history_menu(self):
+        """
+        Add the entries queued by _add_to_history to the top of the history menus.
+
+        The native submenu is patched in place: new items are inserted, the
+        oldest dropped past MAX_ENTRIES, and the remaining titles refreshed so
+        their relative times stay current. rumps keys submenu items by title,
+        so its submenu is still rebuilt, once per flush.
+        """
+        entries, self._pending_history_entries = self._pending_history_entries, []
+        if not entries:
+            return
+        self._rebuild_rumps_history_menu()
+
+        native_menu = self._native_history_menu()
+        if native_menu is None:
+            logging.warning("HISTORY DEBUG: _menu_handler or recent_submenu not found")
+            return
+
+        count = self._native_history_count
+        if count == 0:
+            # Swap the placeholder for the footer on the first entry
+            native_menu.removeAllItems()
+            self._add_native_history_footer(native_menu)
         else:
-            print("HISTORY DEBUG: WARNING - _menu_handler or recent_submenu not found!")
+            for index in range(count):
+                item = native_menu.itemAtIndex_(index)
+                item.setTitle_(item.representedObject().menu_title())
+
+        # Oldest first, so the newest entry ends up on top
+        for entry in entries:
+            native_menu.insertItem_atIndex_(self._new_native_history_item(entry), 0)
+        count += len(entries)
+        while count > TranscriptionHistory.MAX_ENTRIES:
+            native_menu.removeItemAtIndex_(count - 1)
+            count -= 1
+        self._native_history_count = count
 
     def _add_to_history(self, original_text: str, corrected_text: str = None, discarded: bool = False):
-        """Add transcription to history and update menu."""
+        """Add transcription to history and schedule a menu update."""
         status = "discarded" if discarded else "inserted"
-        print(f"HISTORY DEBUG: _add_to_history called ({status}): '{original_text[:30]}...'")
-        self.transcription_history.add(original_text, corrected_text, discarded=discarded)
-        entry_count = len(list(self.transcription_history.get_entries()))
-        print(f"HISTORY DEBUG: History now has {entry_count} entries")
-        print(f"HISTORY DEBUG: Scheduling _update_history_menu via AppHelper.callAfter")
-        AppHelper.callAfter(self._update_history_menu)
+        logging.debug("HISTORY DEBUG: _add_to_history called (%s): '%.30s...'", status, original_text)
+        entry = self.transcription_history.add(original_text, corrected_text, discarded=discarded)
+        logging.debug("HISTORY DEBUG: History now has %d entries", len(self.transcription_history))
+        # Adds landing close together (e.g. send then discard) share one update
+        pending = self._pending_history_entries
+        pending.append(entry)
+        if len(pending) == 1:
+            AppHelper.callLater(HISTORY_MENU_DELAY, self._flush_history_menu)
 
     def _handle_direct_insertion(self, transcription_result, transcribed_text: str, log_id: str):
         """Insert text directly without showing the correction window."""
@@ -1501,8 +1616,7 @@ class DictationApp(rumps.App):
         if source_app:
             target_app_name = source_app.localizedName() or ""
             bundle_id = source_app.bundleIdentifier() or ""
-            non_text_bundles = {"com.apple.finder", "com.apple.dock.extra", "com.apple.loginwindow"}
-            target_likely_text = bundle_id not in non_text_bundles and bundle_id != ""
+            target_likely_text = bundle_id not in _NON_TEXT_BUNDLES and bundle_id != ""
             print(f"MAIN_APP ({log_id}): Source app: '{target_app_name}' ({bundle_id})")
 
             # Restore focus to source app
@@ -1559,6 +1673,29 @@ class DictationApp(rumps.App):
             insertion_thread = threading.Thread(target=insert_in_background, daemon=True)
             insertion_thread.start()
 
+    def _wait_until_active(self, app, timeout=FOCUS_SETTLE_TIMEOUT):
+        """
+        Run the main run loop in short slices until app is frontmost.
+
+        Keeps events flowing while focus moves (the activation notification
+        that updates isActive() is delivered on this run loop) and returns as
+        soon as it settles instead of always sleeping the full timeout.
+
+        Returns:
+            True if app became active before the timeout.
+        """
+        run_loop = NSRunLoop.currentRunLoop()
+        deadline = time.monotonic() + timeout
+        while not app.isActive():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            run_loop.runMode_beforeDate_(
+                NSDefaultRunLoopMode,
+                NSDate.dateWithTimeIntervalSinceNow_(min(FOCUS_POLL_INTERVAL, remaining)),
+            )
+        return True
+
     def _on_correction_send(self, original_text: str, corrected_text: str):
         """Called when user confirms corrected text in the correction window."""
         print(f"MAIN_APP: Correction confirmed. Original: '{original_text[:30]}...', Corrected: '{corrected_text[:30]}...'")
@@ -1569,8 +1706,7 @@ class DictationApp(rumps.App):
             target_app_name = source_app.localizedName() or ""
             bundle_id = source_app.bundleIdentifier() or ""
             # Check if source app is likely to accept text
-            non_text_bundles = {"com.apple.finder", "com.apple.dock.extra", "com.apple.loginwindow"}
-            target_likely_text = bundle_id not in non_text_bundles and bundle_id != ""
+            target_likely_text = bundle_id not in _NON_TEXT_BUNDLES and bundle_id != ""
             print(f"MAIN_APP: Source app (from dictation start): '{target_app_name}' ({bundle_id}), likely_text_accepting: {target_likely_text}")
         else:
             # Fallback to correction window's captured app
@@ -1585,7 +1721,8 @@ class DictationApp(rumps.App):
         if source_app:
             print(f"MAIN_APP: Restoring focus to source app: {target_app_name}")
             source_app.activateWithOptions_(0)
-            time.sleep(0.1)  # Small delay for focus to settle
+            if not self._wait_until_active(source_app):
+                print(f"MAIN_APP: {target_app_name} not frontmost after {FOCUS_SETTLE_TIMEOUT}s, inserting anyway")
         else:
             self.correction_window.restore_previous_app_focus()
 
@@ -1605,21 +1742,21 @@ class DictationApp(rumps.App):
 
                 if insertion_result:
                     msg = f"Text inserted into {target_app_name}." if target_app_name else "Text inserted."
-                    rumps.notification("Transcription Complete", msg, corrected_text[:50])
+                    self._post_notification("Transcription Complete", msg, corrected_text[:50])
                 else:
                     if clipboard_success:
-                        rumps.notification("Insertion Failed",
+                        self._post_notification("Insertion Failed",
                             "Text copied to clipboard. Press Cmd+V to paste.", corrected_text[:50])
                     else:
-                        rumps.notification("Insertion Failed",
+                        self._post_notification("Insertion Failed",
                             "Could not insert or copy text.", corrected_text[:50])
             except Exception as e:
                 print(f"MAIN_APP: Error during text insertion: {e}")
                 if clipboard_success:
-                    rumps.notification("Insertion Error",
+                    self._post_notification("Insertion Error",
                         "Text copied to clipboard. Press Cmd+V to paste.", corrected_text[:50])
                 else:
-                    rumps.notification("Insertion Error", str(e)[:50], corrected_text[:50])
+                    self._post_notification("Insertion Error", str(e)[:50], corrected_text[:50])
 
         self._last_transcribed_text = corrected_text
         self._pending_transcription_text = None  # Clear pending text
@@ -1653,13 +1790,12 @@ class DictationApp(rumps.App):
             self.hotkey_manager.hotkey_active = False
 
         # Cleanup mic if still recording
-        audio_is_recording = getattr(self.audio_manager, "_is_recording", False)
-        if audio_is_recording:
+        if self.audio_manager.is_recording:
             self.audio_manager.stop_recording("from_finish_transcription_cycle")
 
         # Hide the overlay window (it may still be showing processing indicator)
         if self.overlay_window:
-            AppHelper.callAfter(self.overlay_window.hide)
+            self._on_main(self.overlay_window.hide)
 
         self.update_menu_state()
 
@@ -1734,15 +1870,14 @@ class DictationApp(rumps.App):
 
         # Store for deferred update
         self._pending_hotkey = new_hotkey
-        # Stop settings listener/monitor before update to avoid conflicts
-        self._stop_settings_shortcut()
         # Defer the actual update to avoid threading issues with rumps
         print(f"MAIN_APP: Scheduling hotkey update to '{new_hotkey}'")
-        rumps.Timer(self._do_hotkey_update, 0.1).start()
+        AppHelper.callLater(0.1, self._do_hotkey_update, None)
 
-    def _do_hotkey_update(self, timer):
-        """Perform the actual hotkey update (called from timer to avoid threading issues)."""
-        timer.stop()
+    def _do_hotkey_update(self, timer=None):
+        """Perform the actual hotkey update (deferred to avoid threading issues)."""
+        if timer is not None:
+            timer.stop()
         new_hotkey = getattr(self, '_pending_hotkey', None)
         if not new_hotkey:
             return
@@ -1751,6 +1886,7 @@ class DictationApp(rumps.App):
         try:
             if self.hotkey_manager.update_hotkey(new_hotkey):
                 self.hotkey_string = new_hotkey
+                self._start_title = f"Start Dictation ({hotkey_to_display(new_hotkey)})"
                 self.settings_manager.set_hotkey(new_hotkey)
                 self.update_menu_state()
                 rumps.notification(
@@ -1762,9 +1898,7 @@ class DictationApp(rumps.App):
             else:
                 rumps.alert("Hotkey Error", "Failed to update hotkey. Please try again.")
         except Exception as e:
-            print(f"MAIN_APP: Error during hotkey update: {e}")
-            import traceback
-            traceback.print_exc()
+            logging.exception("MAIN_APP: Error during hotkey update: %s", e)
         finally:
             self._pending_hotkey = None
 
@@ -1780,6 +1914,7 @@ class DictationApp(rumps.App):
         self.silence_duration = self.settings_manager.get_silence_duration()
         self.skip_edit_window = self.settings_manager.get_skip_edit_window()
         self.silence_threshold = self.settings_manager.get_silence_threshold()
+        self._silence_threshold_sq = self.silence_threshold * self.silence_threshold
         print(f"MAIN_APP: Settings updated - silence_auto_stop={self.silence_auto_stop_enabled}, "
               f"silence_duration={self.silence_duration}, skip_edit={self.skip_edit_window}, "
               f"silence_threshold={self.silence_threshold}")
@@ -1811,9 +1946,7 @@ class DictationApp(rumps.App):
         if self.hotkey_manager: # Check if hotkey manager was initialized
             self.hotkey_manager.stop_listening()
 
-        print("MAIN_APP: Quit - Stopping settings shortcut.")
-        self._stop_settings_shortcut()
-
+        _shutdown_logging()
         rumps.quit_application()
 
 if __name__ == "__main__":
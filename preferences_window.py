@@ -3,6 +3,8 @@ Native macOS preferences window with hotkey recording.
 Uses PyObjC/AppKit for native integration.
 """
 
+import functools
+
 import objc
 from AppKit import (
     NSWindow, NSView, NSTextField, NSButton,
@@ -49,6 +51,7 @@ RESERVED_HOTKEYS = {
 }
 
 
+@functools.lru_cache(maxsize=16)
 def hotkey_to_display(hotkey_str: str) -> str:
     """Convert pynput format '<cmd>+<shift>+d' to display format 'Cmd+Shift+D'."""
     if not hotkey_str:
@@ -24,6 +24,7 @@ def _install_stub_modules():
 
     audio_manager = types.ModuleType("audio_manager")
     audio_manager.AudioManager = object
+    audio_manager.chunk_sum_of_squares = lambda chunk: 0.0
     sys.modules["audio_manager"] = audio_manager
 
     asr_service = types.ModuleType("asr_service")
@@ -73,6 +74,7 @@ def test_blank_transcription_with_error_schedules_timer():
 
     dummy_app = types.SimpleNamespace(
         _model_loaded_handled=False,
+        _next_log_id=lambda: 1,
         asr_model_status="loaded",
         is_transcribing=False,
         hotkey_manager=types.SimpleNamespace(hotkey_active=False),
@@ -83,9 +85,9 @@ def test_blank_transcription_with_error_schedules_timer():
     main.DictationApp._handle_asr_service_result(dummy_app, "", Exception("boom"))
 
     assert calls, "Expected AppHelper.callAfter to be called for transcription errors"
-    _, payload = calls[0]
-    assert payload["type"] == main.ASR_CALLBACK_TYPE_TRANSCRIPTION
-    assert payload["data"]["error"] is not None
+    _, event = calls[0]
+    assert event.kind == main.ASR_CALLBACK_TYPE_TRANSCRIPTION
+    assert event.error is not None
 
 
 def test_blank_transcription_with_error_triggers_alert():
@@ -94,10 +96,7 @@ def test_blank_transcription_with_error_triggers_alert():
     main.rumps.alert = lambda *args, **kwargs: alerts.append((args, kwargs))
 
     timer = _DummyTimer(
-        {
-            "type": main.ASR_CALLBACK_TYPE_TRANSCRIPTION,
-            "data": {"text": "", "error": Exception("boom")},
-        }
+        main.AsrEvent(main.ASR_CALLBACK_TYPE_TRANSCRIPTION, "", Exception("boom"), "test")
     )
 
     dummy_app = types.SimpleNamespace(
@@ -107,15 +106,19 @@ def test_blank_transcription_with_error_triggers_alert():
         text_insertion_service=types.SimpleNamespace(insert_text=lambda text: True),
         hotkey_manager=types.SimpleNamespace(hotkey_active=False),
         audio_manager=types.SimpleNamespace(
-            _is_recording=False,
+            is_recording=False,
             stop_recording=lambda *args, **kwargs: None,
         ),
         waveform_visualizer=types.SimpleNamespace(stop=lambda: None),
         dictation_active=True,
         is_transcribing=True,
-        active_timers=[timer],
+        _waiting_for_correction=False,
+        active_timers={timer},
         update_menu_state=lambda: None,
     )
+    dummy_app._on_transcription_event = types.MethodType(
+        main.DictationApp._on_transcription_event, dummy_app
+    )
 
     main.DictationApp._process_asr_result_on_main_thread(dummy_app, timer)
 
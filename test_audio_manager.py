@@ -37,3 +37,9 @@ def test_start_recording_returns_false_on_stream_error(monkeypatch):
     assert started is False
     assert manager.get_last_error() is not None
     assert not manager._recording_active_event.is_set()
+
+
+def test_chunk_sum_of_squares_does_not_overflow_int16():
+    chunk = audio_manager.np.array([[30000], [-30000], [5]], dtype=audio_manager.np.int16)
+
+    assert audio_manager.chunk_sum_of_squares(chunk) == 2 * 30000 ** 2 + 25
@@ -1,4 +1,6 @@
+import itertools
 import sys
+import threading
 import types
 
 
@@ -32,7 +34,7 @@ def _install_pynput_stub():
     class HotKey:
         def __init__(self, keys, on_activate):
             self._keys = set(keys)
-            self._pressed = set()
+            self._state = set()
             self._on_activate = on_activate
 
         @staticmethod
@@ -51,15 +53,15 @@ def _install_pynput_stub():
             return keys
 
         def press(self, key):
-            self._pressed.add(key)
-            if self._keys.issubset(self._pressed):
+            self._state.add(key)
+            if self._keys.issubset(self._state):
                 self._on_activate()
 
         def release(self, key):
-            self._pressed.discard(key)
+            self._state.discard(key)
 
     class Listener:
-        def __init__(self, on_press=None, on_release=None):
+        def __init__(self, on_press=None, on_release=None, **kwargs):
             self._on_press = on_press
             self._on_release = on_release
 
@@ -114,3 +116,254 @@ def test_hotkey_ctrl_alt_space_triggers(monkeypatch):
     manager._on_key_release_with_hotkey_detection(keyboard.Key.ctrl)
 
     assert calls == ["on"]
+
+
+def _advance_clock(monkeypatch, step):
+    clock = itertools.count(step=step)
+    monkeypatch.setattr(hotkey_manager.time, "monotonic", lambda: next(clock))
+
+
+def test_hotkey_toggle_respects_external_reset(monkeypatch):
+    monkeypatch.setattr(hotkey_manager.sys, "platform", "linux")
+    _advance_clock(monkeypatch, 1)
+
+    calls = []
+    manager = HotkeyManager(
+        "<ctrl>+<alt>+<space>",
+        lambda: calls.append("on"),
+        lambda: calls.append("off"),
+    )
+
+    manager.on_press()
+    manager.on_press()
+    manager.on_press()
+    assert calls == ["on", "off", "on"]
+    assert manager.hotkey_active is True
+
+    # The app resets the toggle directly when dictation ends on its own
+    manager.hotkey_active = False
+    manager.on_press()
+    assert calls == ["on", "off", "on", "on"]
+    assert manager.hotkey_active is True
+
+
+def test_hotkey_presses_within_debounce_are_ignored(monkeypatch):
+    monkeypatch.setattr(hotkey_manager.sys, "platform", "linux")
+
+    calls = []
+    manager = HotkeyManager(
+        "<ctrl>+<alt>+<space>",
+        lambda: calls.append("on"),
+        lambda: calls.append("off"),
+    )
+
+    now = [100.0]
+    monkeypatch.setattr(hotkey_manager.time, "monotonic", lambda: now[0])
+
+    manager.on_press()
+    now[0] += hotkey_manager.PRESS_DEBOUNCE_SECONDS / 2
+    manager.on_press()
+    assert calls == ["on"]
+
+    now[0] += hotkey_manager.PRESS_DEBOUNCE_SECONDS
+    manager.on_press()
+    assert calls == ["on", "off"]
+
+
+def test_hotkey_callbacks_run_on_worker_thread(monkeypatch):
+    monkeypatch.setattr(hotkey_manager.sys, "platform", "linux")
+
+    fired = threading.Event()
+    callback_threads = []
+
+    def on_activate():
+        callback_threads.append(threading.current_thread())
+        fired.set()
+
+    manager = HotkeyManager("<ctrl>+<alt>+<space>", on_activate, lambda: None)
+    manager.start_listening()
+    try:
+        manager.on_press()
+        assert fired.wait(timeout=1.0)
+    finally:
+        manager.stop_listening()
+
+    assert callback_threads[0] is not threading.current_thread()
+
+
+def test_hotkey_space_keycode_is_matched_from_key_space(monkeypatch):
+    monkeypatch.setattr(hotkey_manager.sys, "platform", "linux")
+
+    # Some pynput variants parse the space as a KeyCode, while listeners
+    # report Key.space
+    space_code = keyboard.KeyCode.from_char(" ")
+    monkeypatch.setattr(
+        keyboard.HotKey, "parse",
+        staticmethod(lambda hotkey_str: [keyboard.Key.ctrl, space_code]),
+    )
+
+    calls = []
+    manager = HotkeyManager("<ctrl>+<space>", lambda: calls.append("on"), lambda: None)
+    assert manager._key_rewrite == {keyboard.Key.space: space_code}
+
+    manager._on_key_press_with_hotkey_detection(keyboard.Key.ctrl)
+    manager._on_key_press_with_hotkey_detection(keyboard.Key.space)
+
+    assert calls == ["on"]
+
+
+def test_update_hotkey_rebinds_existing_hotkey_in_place(monkeypatch):
+    monkeypatch.setattr(hotkey_manager.sys, "platform", "linux")
+
+    calls = []
+    manager = HotkeyManager("<ctrl>+<alt>+<space>", lambda: calls.append("on"), lambda: None)
+    original = manager._hotkey
+
+    assert manager.update_hotkey("<ctrl>+<shift>+<space>")
+    assert manager._hotkey is original
+
+    manager._on_key_press_with_hotkey_detection(keyboard.Key.ctrl)
+    manager._on_key_press_with_hotkey_detection(keyboard.Key.alt)
+    manager._on_key_press_with_hotkey_detection(keyboard.Key.space)
+    assert calls == []
+
+    manager._on_key_press_with_hotkey_detection(keyboard.Key.shift)
+    assert calls == ["on"]
+
+
+def test_hotkey_rearms_after_release(monkeypatch):
+    monkeypatch.setattr(hotkey_manager.sys, "platform", "linux")
+    _advance_clock(monkeypatch, 1)
+
+    calls = []
+    manager = HotkeyManager(
+        "<ctrl>+<alt>+<space>",
+        lambda: calls.append("on"),
+        lambda: calls.append("off"),
+    )
+
+    for _ in range(2):
+        for key in (keyboard.Key.ctrl, keyboard.Key.alt, keyboard.Key.space):
+            manager._on_key_press_with_hotkey_detection(key)
+        # Unrelated keys are ignored on release
+        manager._on_key_release_with_hotkey_detection(keyboard.KeyCode.from_char("x"))
+        for key in (keyboard.Key.space, keyboard.Key.alt, keyboard.Key.ctrl):
+            manager._on_key_release_with_hotkey_detection(key)
+
+    assert calls == ["on", "off"]
+
+
+def test_hotkey_matches_canonical_keys(monkeypatch):
+    monkeypatch.setattr(hotkey_manager.sys, "platform", "linux")
+
+    class CanonicalListener(keyboard.Listener):
+        def canonical(self, key):
+            if isinstance(key, keyboard.KeyCode) and key.char is not None:
+                return keyboard.KeyCode.from_char(key.char.lower())
+            return key
+
+    monkeypatch.setattr(keyboard, "Listener", CanonicalListener)
+
+    fired = threading.Event()
+    manager = HotkeyManager("<ctrl>+d", fired.set, lambda: None)
+    manager.start_listening()
+    try:
+        manager._on_key_press_with_hotkey_detection(keyboard.Key.ctrl)
+        manager._on_key_press_with_hotkey_detection(keyboard.KeyCode.from_char("D"))
+        assert fired.wait(timeout=1.0)
+    finally:
+        manager.stop_listening()
+
+
+class _FakeNSEvent:
+    def __init__(self, key_code, flags):
+        self._key_code = key_code
+        self._flags = flags
+
+    def keyCode(self):
+        return self._key_code
+
+    def modifierFlags(self):
+        return self._flags
+
+
+def test_native_event_matches_on_keycode_and_modifier_mask(monkeypatch):
+    monkeypatch.setattr(hotkey_manager.sys, "platform", "linux")
+    _advance_clock(monkeypatch, 1)
+
+    calls = []
+    manager = HotkeyManager("<cmd>+<shift>+d", lambda: calls.append("on"), lambda: None)
+    cmd_shift = (hotkey_manager.NSEventModifierFlagCommand
+                 | hotkey_manager.NSEventModifierFlagShift)
+    d = hotkey_manager.KEY_NAME_TO_CODE["d"]
+
+    # Wrong key, missing modifier, extra modifier
+    manager._handle_native_event(_FakeNSEvent(hotkey_manager.KEY_NAME_TO_CODE["f"], cmd_shift))
+    manager._handle_native_event(_FakeNSEvent(d, hotkey_manager.NSEventModifierFlagCommand))
+    manager._handle_native_event(
+        _FakeNSEvent(d, cmd_shift | hotkey_manager.NSEventModifierFlagOption)
+    )
+    assert calls == []
+
+    # Caps lock does not take part in matching
+    manager._handle_native_event(
+        _FakeNSEvent(d, cmd_shift | hotkey_manager.NSEventModifierFlagCapsLock)
+    )
+    assert calls == ["on"]
+
+
+def test_dropped_hotkey_press_does_not_toggle(monkeypatch):
+    monkeypatch.setattr(hotkey_manager.sys, "platform", "linux")
+
+    manager = HotkeyManager("<ctrl>+<alt>+<space>", lambda: None, lambda: None)
+    monkeypatch.setattr(manager, "_dispatch", lambda callback: False)
+
+    manager.on_press()
+
+    assert manager.hotkey_active is False
+
+
+def test_secondary_hotkey_fires_without_toggling(monkeypatch):
+    monkeypatch.setattr(hotkey_manager.sys, "platform", "linux")
+
+    calls = []
+    manager = HotkeyManager("<ctrl>+<alt>+<space>", lambda: calls.append("on"), lambda: None)
+    assert manager.register_secondary("<cmd>+,", lambda: calls.append("settings"))
+
+    comma = keyboard.KeyCode.from_char(",")
+    manager._on_key_press_with_hotkey_detection(keyboard.Key.cmd)
+    manager._on_key_press_with_hotkey_detection(comma)
+    manager._on_key_release_with_hotkey_detection(comma)
+    manager._on_key_release_with_hotkey_detection(keyboard.Key.cmd)
+
+    # Native path: Cmd+, matches, Cmd+Shift+, does not
+    comma_code = hotkey_manager.KEY_NAME_TO_CODE[","]
+    manager._handle_native_event(_FakeNSEvent(comma_code, hotkey_manager.NSEventModifierFlagCommand))
+    manager._handle_native_event(
+        _FakeNSEvent(comma_code, hotkey_manager.NSEventModifierFlagCommand
+                     | hotkey_manager.NSEventModifierFlagShift)
+    )
+
+    assert calls == ["settings", "settings"]
+    assert manager.hotkey_active is False
+
+
+def test_disabled_toggle_ignores_hotkey_but_not_secondary(monkeypatch):
+    monkeypatch.setattr(hotkey_manager.sys, "platform", "linux")
+
+    calls = []
+    manager = HotkeyManager("<ctrl>+<alt>+<space>", lambda: calls.append("on"), lambda: None)
+    manager.register_secondary("<cmd>+,", lambda: calls.append("settings"))
+    manager.toggle_enabled = False
+
+    manager.on_press()
+    comma = keyboard.KeyCode.from_char(",")
+    manager._on_key_press_with_hotkey_detection(keyboard.Key.cmd)
+    manager._on_key_press_with_hotkey_detection(comma)
+
+    assert calls == ["settings"]
+    assert manager.hotkey_active is False
+
+    manager.toggle_enabled = True
+    manager.on_press()
+    assert calls == ["settings", "on"]
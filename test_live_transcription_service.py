@@ -0,0 +1,132 @@
+import sys
+import types
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+
+from live_transcription_service import LiveTranscriptionService
+
+
+def _service(sample_rate=10):
+    service = LiveTranscriptionService(None, lambda text: None, sample_rate=sample_rate)
+    # Accept chunks without starting the preview thread
+    service._is_active = True
+    return service
+
+
+def test_add_audio_chunk_flattens_int16():
+    service = _service()
+    service.add_audio_chunk(np.array([[16384], [-32768]], dtype=np.int16))
+
+    np.testing.assert_array_equal(service._buf[:service._write], [16384, -32768])
+
+
+def test_preview_audio_is_scaled_float32():
+    service = _service(sample_rate=4)
+    service.add_audio_chunk(np.array([16384, -32768, 0, 8192], dtype=np.int16))
+
+    audio = service._take_preview_audio()
+
+    assert audio.dtype == np.float32
+    np.testing.assert_allclose(audio, [0.5, -1.0, 0.0, 0.25])
+
+
+def test_audio_buffer_grows_past_initial_capacity(monkeypatch):
+    monkeypatch.setattr(LiveTranscriptionService, "INITIAL_BUFFER_SECONDS", 1)
+    service = _service(sample_rate=4)
+
+    chunks = [np.arange(i * 3, i * 3 + 3, dtype=np.int16) for i in range(5)]
+    for chunk in chunks:
+        service.add_audio_chunk(chunk)
+
+    np.testing.assert_array_equal(service._buf[:service._write], np.concatenate(chunks))
+
+
+def test_clear_buffer_discards_audio():
+    service = _service()
+    service.add_audio_chunk(np.ones(5, dtype=np.int16))
+
+    service.clear_buffer()
+
+    assert service._write == 0
+
+
+def test_preview_audio_is_trailing_window_of_new_audio(monkeypatch):
+    monkeypatch.setattr(LiveTranscriptionService, "PREVIEW_WINDOW_SECONDS", 2.0)
+    monkeypatch.setattr(LiveTranscriptionService, "MIN_AUDIO_LENGTH", 0.5)
+    service = _service(sample_rate=10)
+
+    service.add_audio_chunk(np.arange(30, dtype=np.int16))
+    audio = service._take_preview_audio()
+    np.testing.assert_allclose(audio * 32768.0, np.arange(10, 30))
+
+    # Nothing new since the last preview
+    assert service._take_preview_audio() is None
+
+    service.add_audio_chunk(np.arange(30, 35, dtype=np.int16))
+    assert service._take_preview_audio().size == 20
+
+
+def test_preview_audio_survives_buffer_reset():
+    service = _service(sample_rate=10)
+    service.add_audio_chunk(np.full(10, 100, dtype=np.int16))
+    audio = service._take_preview_audio()
+
+    service.clear_buffer()
+    service.add_audio_chunk(np.full(10, -100, dtype=np.int16))
+
+    np.testing.assert_allclose(audio * 32768.0, np.full(10, 100))
+
+
+def test_queued_previews_coalesce_to_latest(monkeypatch):
+    scheduled = []
+    app_helper = types.SimpleNamespace(callAfter=scheduled.append)
+    monkeypatch.setitem(sys.modules, "PyObjCTools", types.SimpleNamespace(AppHelper=app_helper))
+
+    shown = []
+    service = LiveTranscriptionService(None, shown.append)
+
+    service._post_preview("hello")
+    service._post_preview("hello world")
+    assert len(scheduled) == 1
+
+    scheduled[0]()
+    assert shown == ["hello world"]
+
+
+def test_preview_waits_for_minimum_new_audio(monkeypatch):
+    monkeypatch.setattr(LiveTranscriptionService, "MIN_AUDIO_LENGTH", 0.5)
+    service = _service(sample_rate=10)
+
+    service.add_audio_chunk(np.ones(4, dtype=np.int16))
+    assert service._take_preview_audio() is None
+
+    service.add_audio_chunk(np.ones(1, dtype=np.int16))
+    assert service._take_preview_audio().size == 5
+
+
+def test_preview_text_accepts_hypothesis_results():
+    from live_transcription_service import _result_text
+
+    assert _result_text("plain") == "plain"
+    assert _result_text(types.SimpleNamespace(text="from hypothesis")) == "from hypothesis"
+    assert _result_text(types.SimpleNamespace(text=None)) == ""
+
+
+def test_preview_skips_while_model_lock_is_held():
+    import threading
+
+    calls = []
+    model = types.SimpleNamespace(transcribe=lambda *args, **kwargs: calls.append(args) or ["hi"])
+    asr = types.SimpleNamespace(asr_model=model, is_model_loaded=True, model_lock=threading.Lock())
+    service = LiveTranscriptionService(asr, lambda text: None)
+    service._asr_model_ref = model
+    service._model_lock = asr.model_lock
+
+    with asr.model_lock:
+        service._request_preview_transcription(np.zeros(4, dtype=np.float32), threading.Event())
+
+    assert calls == []
+    assert not asr.model_lock.locked()
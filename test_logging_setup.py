@@ -3,6 +3,7 @@ import os
 import sys
 import types
 import logging
+import logging.handlers
 
 
 def _install_stub_modules():
@@ -25,6 +26,7 @@ def _install_stub_modules():
 
     audio_manager = types.ModuleType("audio_manager")
     audio_manager.AudioManager = object
+    audio_manager.chunk_sum_of_squares = lambda chunk: 0.0
     sys.modules["audio_manager"] = audio_manager
 
     asr_service = types.ModuleType("asr_service")
@@ -49,7 +51,7 @@ def _install_stub_modules():
     sys.modules["PyObjCTools"] = pyobjc_tools
 
 
-def test_logging_setup_falls_back_on_permission_error(monkeypatch, tmp_path):
+def _prepare_main_import(tmp_path):
     logging.getLogger().handlers.clear()
     for module_name in (
         "main",
@@ -67,9 +69,23 @@ def test_logging_setup_falls_back_on_permission_error(monkeypatch, tmp_path):
     _install_stub_modules()
     os.environ["HOME"] = str(tmp_path)
 
+
+def test_logging_setup_falls_back_on_permission_error(monkeypatch, tmp_path):
+    _prepare_main_import(tmp_path)
+
     def _raise_permission(*_args, **_kwargs):
         raise PermissionError("denied")
 
-    monkeypatch.setattr(logging, "FileHandler", _raise_permission)
+    monkeypatch.setattr(logging.handlers, "RotatingFileHandler", _raise_permission)
 
     importlib.import_module("main")
+
+
+def test_root_logger_is_info_unless_yt_debug(monkeypatch, tmp_path):
+    monkeypatch.delenv("YT_DEBUG", raising=False)
+    _prepare_main_import(tmp_path)
+
+    main = importlib.import_module("main")
+    main._shutdown_logging()
+
+    assert logging.getLogger().level == logging.INFO